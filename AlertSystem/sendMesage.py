@@ -3,10 +3,14 @@ import os
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Get API token and sender info from .env
 API_TOKEN = os.getenv("AFROMESSAGE_API_TOKEN")
 SENDER_ID = "AAU-CVMA"  # Optional short code
@@ -14,17 +18,51 @@ SENDER_NAME = os.getenv("AFROMESSAGE_SENDER_NAME", "Cowsville")  # Optional send
 
 # Development mode - don't require API token
 if not API_TOKEN:
-    logging.warning(
+    logger.warning(
         "⚠️ Development mode: AFROMESSAGE_API_TOKEN not set. SMS sending is disabled."
     )
     API_TOKEN = "development_token"
 
+# Resolved once at import; send_alert short-circuits on this in development mode
+DEV_MODE = API_TOKEN == "development_token"
+
+# Shared response returned for every dev-mode send (callers only read it)
+_DEV_RESPONSE = {
+    "status": "success",
+    "response": {
+        "acknowledge": "success",
+        "message": "Development mode - no actual SMS sent",
+    },
+}
+
 # API Details
 BASE_URL = "https://api.afromessage.com/api/send"
 HEADERS = {"Authorization": f"Bearer {API_TOKEN}"}
 
-# Create a session object
+# Constant part of every send request body
+PAYLOAD_BASE = {
+    "sender": SENDER_ID,  # Short code/sender ID if you have one
+    "callback": "",  # Optional callback URL
+}
+
+# (connect, read) timeout in seconds so a stalled API call can't hang the daily checks
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Create a session object with a pooled, retrying adapter so keep-alive connections
+# are reused across sends and transient 429/5xx responses are retried with backoff
 session = requests.Session()
+retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET", "POST"),
+    raise_on_status=False,  # Hand the final response to the HTTP error branch below
+)
+adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+# Auth header is constant, so set it on the session instead of merging it per call
+session.headers.update(HEADERS)
 
 
 def send_alert(phone_number, message):
@@ -36,39 +74,35 @@ def send_alert(phone_number, message):
     :return: API response or error message.
     """
     # In development mode, just log the message instead of sending it
-    if API_TOKEN == "development_token":
-        logging.info(f"📱 [DEV MODE] Would send SMS to {phone_number}: {message}")
-        return {
-            "status": "success",
-            "response": {
-                "acknowledge": "success",
-                "message": "Development mode - no actual SMS sent",
-            },
-        }
+    if DEV_MODE:
+        logger.log(
+            logging.INFO,
+            "📱 [DEV MODE] Would send SMS to %s: %s",
+            phone_number,
+            message,
+        )
+        return _DEV_RESPONSE
 
     try:
-        # Construct the request URL with proper sender info
-        params = {  # Sender name (e.g., "Cowsville")
-            "sender": SENDER_ID,  # Short code/sender ID if you have one
-            "to": phone_number,
-            "message": message,
-            "callback": "",  # Optional callback URL
-        }
+        # Only the recipient and text vary per call
+        payload = {**PAYLOAD_BASE, "to": phone_number, "message": message}
 
-        response = session.get(BASE_URL, headers=HEADERS, params=params)
+        response = session.post(BASE_URL, json=payload, timeout=REQUEST_TIMEOUT)
 
         # Check if the request was successful
         if response.status_code == 200:
             json_response = response.json()
             if json_response.get("acknowledge") == "success":
-                logging.info(f"✅ SMS sent successfully to {phone_number}")
+                logger.info("✅ SMS sent successfully to %s", phone_number)
                 return {"status": "success", "response": json_response}
             else:
-                logging.error(f"❌ API error: {json_response}")
+                logger.error("❌ API error: %s", json_response)
                 return {"status": "error", "response": json_response}
         else:
-            logging.error(
-                f"❌ HTTP error: Code {response.status_code}, Message: {response.text}"
+            logger.error(
+                "❌ HTTP error: Code %s, Message: %s",
+                response.status_code,
+                response.text,
             )
             return {
                 "status": "http_error",
@@ -77,5 +111,5 @@ def send_alert(phone_number, message):
             }
 
     except requests.RequestException as e:
-        logging.error(f"❌ Network error: {str(e)}")
+        logger.error("❌ Network error: %s", e)
         return {"status": "network_error", "message": str(e)}
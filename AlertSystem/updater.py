@@ -1,6 +1,9 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
 
+from django.db.models import Q
 from django.utils.timezone import now
 
 from FarmManager.constants import MessageTemplates, MessageTypes
@@ -11,164 +14,301 @@ from .sendMesage import send_alert
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of SMS requests allowed in flight at once during a daily check
+MAX_SEND_WORKERS = 16
+
+# Days without a new heat sign before a non-pregnant cow gets a reminder
+HEAT_SIGN_THRESHOLD_DAYS = 18
+
+# Days within which the same alert is not repeated for a cow
+ALERT_DEDUP_DAYS = 7
+
+ALERT_DESCRIPTIONS = {
+    MessageTypes.HEAT_MONITORING_ALERT: "Heat monitoring alert",
+    MessageTypes.CALVING_2_MONTHS_ALERT: "2-month calving reminder",
+    MessageTypes.CALVING_1_MONTH_ALERT: "1-month calving reminder",
+    MessageTypes.CALVING_DUE_ALERT: "calving due date alert",
+}
+
+
+def _send_alerts_concurrently(jobs):
+    """Send (phone_number, message_text) jobs in parallel, returning responses in order"""
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=MAX_SEND_WORKERS) as executor:
+        return list(executor.map(lambda job: send_alert(*job), jobs))
+
+
+def _run_alerts(reproductions, message_types, classify, build_message, today=None):
+    """
+    Shared driver for the daily alert checks.
+
+    ``classify(reproduction, today)`` returns the alert type due for a record (or
+    None), and ``build_message(reproduction, alert_type, today)`` renders its text.
+    Recent alerts are loaded in one query, SMS are sent concurrently and the
+    resulting Message rows are bulk inserted. ``today`` defaults to the current date.
+
+    Returns:
+        Tuple of (records checked, alerts sent)
+    """
+    if today is None:
+        today = now().date()
+    dedup_cutoff = today - timedelta(days=ALERT_DEDUP_DAYS)
+
+    # (farm_id, cow_id, message_type) triples already alerted within the dedup window
+    recent_alerts = set(
+        Message.objects.filter(
+            message_type__in=message_types,
+            sent_date__gte=dedup_cutoff,
+        ).values_list("farm_id", "cow_id", "message_type")
+    )
 
-def check_heat_sign_alerts():
-    """Checks non-pregnant cows for heat sign alerts and sends notifications if necessary"""
-    today = now().date()
-    threshold_days = 18  # Days before sending an alert
-    alert_count = 0
-
-    # Get cows that are NOT pregnant
-    cows = Reproduction.objects.filter(is_cow_pregnant=False)
-
-    for cow_reproduction in cows:
-        if cow_reproduction.heat_sign_start:
-            days_since_last_heat = (
-                today - cow_reproduction.heat_sign_start.date()
-            ).days
+    # Collect the alerts to send before dispatching them concurrently
+    pending = []
+    checked_count = 0
+    for cow_reproduction in reproductions:
+        checked_count += 1
+        alert_type = classify(cow_reproduction, today)
+        if alert_type is None:
+            continue
+
+        # Skip cows already alerted before doing any message formatting
+        alert_key = (cow_reproduction.farm_id, cow_reproduction.cow_id, alert_type)
+        if alert_key in recent_alerts:
+            continue
+
+        message_text = build_message(cow_reproduction, alert_type, today)
+        pending.append((cow_reproduction, alert_type, message_text))
+        # A cow with several live records gets the alert once per run
+        recent_alerts.add(alert_key)
+
+    alert_responses = _send_alerts_concurrently(
+        [
+            (cow_reproduction.farm.telephone_number, message_text)
+            for cow_reproduction, _, message_text in pending
+        ]
+    )
 
-            if days_since_last_heat >= threshold_days:
-                # Check if we already sent an alert recently (within last 7 days)
-                recent_alert = Message.objects.filter(
+    to_create = []
+    for (cow_reproduction, alert_type, message_text), alert_response in zip(
+        pending, alert_responses
+    ):
+        # Record message only if alert was sent successfully
+        if alert_response.get("status") == "success":
+            to_create.append(
+                Message(
                     farm=cow_reproduction.farm,
                     cow=cow_reproduction.cow,
-                    message_type=MessageTypes.HEAT_MONITORING_ALERT,
-                    sent_date__gte=today - timedelta(days=7),
-                ).exists()
-
-                if not recent_alert:
-                    # Use new message template
-                    message_text = MessageTemplates.heat_monitoring_reminder(
-                        cow_reproduction.cow.cow_id,
-                        days_since_last_heat,
-                        cow_reproduction.heat_sign_start.strftime("%Y-%m-%d"),
-                    )
-
-                    # Send alert first
-                    alert_response = send_alert(
-                        cow_reproduction.farm.telephone_number, message_text
-                    )
-
-                    # Create message record only if alert was sent successfully
-                    if alert_response.get("status") == "success":
-                        Message.objects.create(
-                            farm=cow_reproduction.farm,
-                            cow=cow_reproduction.cow,
-                            message_text=message_text,
-                            message_type=MessageTypes.HEAT_MONITORING_ALERT,
-                            is_sent=True,
-                        )
-                        alert_count += 1
-                        logger.info(
-                            f"✅ Heat monitoring alert sent for Cow {cow_reproduction.cow.cow_id} "
-                            f"({days_since_last_heat} days since last heat)"
-                        )
-                    else:
-                        logger.error(
-                            f"❌ Failed to send heat alert for Cow {cow_reproduction.cow.cow_id}: "
-                            f"{alert_response.get('message')}"
-                        )
+                    message_text=message_text,
+                    message_type=alert_type,
+                    is_sent=True,
+                )
+            )
+            logger.info(
+                "✅ %s sent for Cow %s",
+                ALERT_DESCRIPTIONS[alert_type],
+                cow_reproduction.cow.cow_id,
+            )
+        else:
+            logger.error(
+                "❌ Failed to send %s for Cow %s: %s",
+                ALERT_DESCRIPTIONS[alert_type],
+                cow_reproduction.cow.cow_id,
+                alert_response.get("message"),
+            )
+
+    # Insert all message records in batches instead of one INSERT per alert
+    Message.objects.bulk_create(to_create, batch_size=500)
+
+    return checked_count, len(to_create)
+
+
+def _classify_heat_sign(cow_reproduction, today):
+    days_since_last_heat = (today - cow_reproduction.heat_sign_start.date()).days
+    if days_since_last_heat >= HEAT_SIGN_THRESHOLD_DAYS:
+        return MessageTypes.HEAT_MONITORING_ALERT
+    return None
+
+
+def _build_heat_sign_message(cow_reproduction, alert_type, today):
+    return MessageTemplates.heat_monitoring_reminder(
+        cow_reproduction.cow.cow_id,
+        (today - cow_reproduction.heat_sign_start.date()).days,
+        cow_reproduction.heat_sign_start.strftime("%Y-%m-%d"),
+    )
+
+
+# (min days, max days, alert type, template) for each calving reminder window
+CALVING_WINDOWS = (
+    # 2 months (around 60 days)
+    (
+        58,
+        62,
+        MessageTypes.CALVING_2_MONTHS_ALERT,
+        MessageTemplates.calving_2_months_alert,
+    ),
+    # 1 month (around 30 days)
+    (
+        28,
+        32,
+        MessageTypes.CALVING_1_MONTH_ALERT,
+        MessageTemplates.calving_1_month_alert,
+    ),
+    # Due date (±2 days)
+    (-2, 2, MessageTypes.CALVING_DUE_ALERT, MessageTemplates.calving_due_alert),
+)
+
+CALVING_TEMPLATES = {
+    alert_type: template for _, _, alert_type, template in CALVING_WINDOWS
+}
+
+
+@lru_cache(maxsize=1)
+def _calving_date_windows(today):
+    """Turn CALVING_WINDOWS day offsets into (first date, last date, alert type) for a run"""
+    return tuple(
+        (today + timedelta(days=low), today + timedelta(days=high), alert_type)
+        for low, high, alert_type, _ in CALVING_WINDOWS
+    )
+
+
+def _classify_calving(cow_reproduction, today):
+    calving_date = cow_reproduction.calving_date
+
+    # Compare against precomputed window dates rather than doing day math per cow
+    for first_date, last_date, alert_type in _calving_date_windows(today):
+        if first_date <= calving_date <= last_date:
+            return alert_type
+    return None
+
+
+def _build_calving_message(cow_reproduction, alert_type, today):
+    return CALVING_TEMPLATES[alert_type](
+        cow_reproduction.cow.cow_id,
+        cow_reproduction.calving_date.strftime("%Y-%m-%d"),
+        cow_reproduction.cow.lactation_number or 1,
+    )
+
+
+def check_heat_sign_alerts(today=None):
+    """Checks non-pregnant cows for heat sign alerts and sends notifications if necessary"""
+    if today is None:
+        today = now().date()
+    threshold_date = today - timedelta(days=HEAT_SIGN_THRESHOLD_DAYS)
+
+    # Get cows that are NOT pregnant and past the heat threshold, joining cow/farm
+    # up front to avoid N+1 lookups
+    cows = (
+        Reproduction.objects.filter(
+            is_cow_pregnant=False,
+            heat_sign_start__isnull=False,
+            heat_sign_start__date__lte=threshold_date,
+        )
+        .select_related("cow", "farm")
+        .only(
+            # Only the columns the check reads; FK/PK columns are always loaded
+            "heat_sign_start",
+            "farm__telephone_number",
+            "cow__cow_id",
+        )
+    )
+
+    cow_count, alert_count = _run_alerts(
+        cows,
+        [MessageTypes.HEAT_MONITORING_ALERT],
+        _classify_heat_sign,
+        _build_heat_sign_message,
+        today,
+    )
 
     logger.info(
-        f"Heat sign check complete: {alert_count} alerts sent out of {len(cows)} non-pregnant cows"
+        "Heat sign check complete: %s alerts sent out of %s non-pregnant cows due for heat monitoring",
+        alert_count,
+        cow_count,
     )
-    return f"Checked {len(cows)} non-pregnant cows, sent {alert_count} heat monitoring alerts"
+    return f"Checked {cow_count} non-pregnant cows due for heat monitoring, sent {alert_count} heat monitoring alerts"
 
 
-def check_pregnancy_alerts():
+def check_pregnancy_alerts(today=None):
     """Checks pregnant cows for calving alerts (2 months, 1 month, and due date)"""
-    today = now().date()
-    alert_count = 0
+    if today is None:
+        today = now().date()
+
+    # Only fetch cows whose calving date falls inside one of the alert windows
+    in_alert_window = Q()
+    for first_date, last_date, _ in _calving_date_windows(today):
+        in_alert_window |= Q(calving_date__range=(first_date, last_date))
 
     # Get pregnant cows with expected calving dates
-    pregnant_cows = Reproduction.objects.filter(
-        is_cow_pregnant=True, calving_date__isnull=False
+    pregnant_cows = (
+        Reproduction.objects.filter(is_cow_pregnant=True, calving_date__isnull=False)
+        .filter(in_alert_window)
+        .select_related("cow", "farm")
+        .only(
+            "calving_date",
+            "farm__telephone_number",
+            "cow__cow_id",
+            "cow__lactation_number",
+        )
     )
 
-    for cow_reproduction in pregnant_cows:
-        expected_calving_date = cow_reproduction.calving_date
-        days_until_calving = (expected_calving_date - today).days
-
-        # Determine which alert to send based on days until calving
-        alert_type = None
-        message_template = None
-
-        if 58 <= days_until_calving <= 62:  # 2 months (around 60 days)
-            alert_type = MessageTypes.CALVING_2_MONTHS_ALERT
-            message_template = MessageTemplates.calving_2_months_alert
-        elif 28 <= days_until_calving <= 32:  # 1 month (around 30 days)
-            alert_type = MessageTypes.CALVING_1_MONTH_ALERT
-            message_template = MessageTemplates.calving_1_month_alert
-        elif -2 <= days_until_calving <= 2:  # Due date (±2 days)
-            alert_type = MessageTypes.CALVING_DUE_ALERT
-            message_template = MessageTemplates.calving_due_alert
-
-        if alert_type and message_template:
-            # Check if we already sent this type of alert for this cow
-            existing_alert = Message.objects.filter(
-                farm=cow_reproduction.farm,
-                cow=cow_reproduction.cow,
-                message_type=alert_type,
-                sent_date__gte=today - timedelta(days=7),  # Within last 7 days
-            ).exists()
-
-            if not existing_alert:
-                # Create the alert message
-                message_text = message_template(
-                    cow_reproduction.cow.cow_id,
-                    expected_calving_date.strftime("%Y-%m-%d"),
-                    cow_reproduction.cow.lactation_number or 1,
-                )
-
-                # Send alert first
-                alert_response = send_alert(
-                    cow_reproduction.farm.telephone_number, message_text
-                )
-
-                # Create message record only if alert was sent successfully
-                if alert_response.get("status") == "success":
-                    Message.objects.create(
-                        farm=cow_reproduction.farm,
-                        cow=cow_reproduction.cow,
-                        message_text=message_text,
-                        message_type=alert_type,
-                        is_sent=True,
-                    )
-                    alert_count += 1
-
-                    alert_description = {
-                        MessageTypes.CALVING_2_MONTHS_ALERT: "2-month calving reminder",
-                        MessageTypes.CALVING_1_MONTH_ALERT: "1-month calving reminder",
-                        MessageTypes.CALVING_DUE_ALERT: "calving due date alert",
-                    }
-
-                    logger.info(
-                        f"✅ {alert_description[alert_type]} sent for Cow {cow_reproduction.cow.cow_id} "
-                        f"(due in {days_until_calving} days)"
-                    )
-                else:
-                    logger.error(
-                        f"❌ Failed to send pregnancy alert for Cow {cow_reproduction.cow.cow_id}: "
-                        f"{alert_response.get('message')}"
-                    )
+    cow_count, alert_count = _run_alerts(
+        pregnant_cows,
+        list(CALVING_TEMPLATES),
+        _classify_calving,
+        _build_calving_message,
+        today,
+    )
 
     logger.info(
-        f"Pregnancy check complete: {alert_count} alerts sent out of {len(pregnant_cows)} pregnant cows"
+        "Pregnancy check complete: %s alerts sent out of %s pregnant cows near calving",
+        alert_count,
+        cow_count,
     )
-    return f"Checked {len(pregnant_cows)} pregnant cows, sent {alert_count} pregnancy alerts"
+    return f"Checked {cow_count} pregnant cows near calving, sent {alert_count} pregnancy alerts"
 
 
 def run_daily_checks():
     """Run all daily monitoring checks"""
     logger.info("🔄 Starting daily farm monitoring checks...")
 
+    # Resolve the run date once so both checks agree on it
+    today = now().date()
+
     # Run heat sign alerts for non-pregnant cows
-    heat_result = check_heat_sign_alerts()
+    heat_result = check_heat_sign_alerts(today)
 
     # Run pregnancy monitoring alerts for pregnant cows
-    pregnancy_result = check_pregnancy_alerts()
+    pregnancy_result = check_pregnancy_alerts(today)
 
     logger.info("✅ Daily farm monitoring checks completed")
-    logger.info(f"📊 Summary - Heat: {heat_result} | Pregnancy: {pregnancy_result}")
+    logger.info("📊 Summary - Heat: %s | Pregnancy: %s", heat_result, pregnancy_result)
 
     return f"Daily checks completed - {heat_result} | {pregnancy_result}"
+
+
+def start():
+    """
+    Run the daily checks on a blocking APScheduler loop.
+
+    This is meant to run in its own process via ``python manage.py run_scheduler``
+    so that only one scheduler exists regardless of how many web workers are up.
+    """
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
+    scheduler = BlockingScheduler()
+    scheduler.add_job(
+        run_daily_checks,
+        "interval",
+        hours=24,
+        id="daily_farm_monitoring",
+        # Run once right away, then every 24 hours
+        next_run_time=now(),
+        # Never stack overlapping runs if a check overruns its interval
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+        replace_existing=True,
+    )
+    logger.info("⏰ Daily farm monitoring scheduler started")
+    scheduler.start()
@@ -42,7 +42,7 @@ class CowAdmin(admin.ModelAdmin):
     # Optimize queries to prevent N+1 problem
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related("farm", "breed", "gynecological_status")
+        return qs.with_related()
 
 
 @admin.register(Doctor)
@@ -68,7 +68,7 @@ class MessageAdmin(admin.ModelAdmin):
     # Optimize queries to prevent N+1 problem
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related("farm", "cow")
+        return qs.with_related()
 
 
 @admin.register(MedicalAssessment)
@@ -81,9 +81,7 @@ class MedicalAssessmentAdmin(admin.ModelAdmin):
     # Optimize queries to prevent N+1 problem
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related(
-            "farm", "cow", "assessed_by", "general_health", "udder_health", "mastitis"
-        )
+        return qs.with_related()
 
 
 @admin.register(InseminationRecord)
@@ -96,7 +94,7 @@ class InseminationRecordAdmin(admin.ModelAdmin):
     # Optimize queries to prevent N+1 problem
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related("farm", "cow", "inseminator")
+        return qs.with_related()
 
 
 @admin.register(FarmerMedicalReport)
@@ -109,7 +107,7 @@ class FarmerMedicalReportAdmin(admin.ModelAdmin):
     # Optimize queries to prevent N+1 problem
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related("farm", "cow", "reviewed_by")
+        return qs.with_related()
 
 
 @admin.register(Reproduction)
@@ -128,7 +126,7 @@ class ReproductionAdmin(admin.ModelAdmin):
     # Optimize queries to prevent N+1 problem
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related("farm", "cow")
+        return qs.with_related()
 
 
 # Register choice models
@@ -1,6 +1,3 @@
-import os
-import sys
-
 from django.apps import AppConfig
 
 
@@ -9,33 +6,10 @@ class FarmManagerConfig(AppConfig):
     name = "FarmManager"
 
     def ready(self):
-        # Import signals to ensure they are registered
-        try:
-            import FarmManager.signals
-        except ImportError:
-            pass
-
-
-# from django.apps import AppConfig
-# import os
-# import sys
-
-
-# class FarmManagerConfig(AppConfig):
-#     default_auto_field = "django.db.models.BigAutoField"
-#     name = "FarmManager"
-
-#     def ready(self):
-#         import FarmManager.signals
-#         # Check if running a management command like migrate or makemigrations
-#         is_management_command = any(
-#             cmd in sys.argv for cmd in ['makemigrations', 'migrate', 'showmigrations']
-#         )
+        # Import signals to ensure they are registered; a broken signals module
+        # should fail startup rather than silently skip the farm count receivers
+        import FarmManager.signals  # noqa: F401
 
-#         if os.environ.get("RUN_MAIN", None) != "true" and not is_management_command:
-#             try:
-#                 from AlertSystem import updater
-#                 updater.start()
-#             except Exception as e:
-#                 # Handle potential errors during updater start, e.g., missing dependencies
-#                 print(f"Warning: Could not start AlertSystem updater: {e}")
+        # The alert scheduler is intentionally not started here: ready() runs once
+        # per web worker, which would send duplicate SMS. Run it in a single
+        # dedicated process with `python manage.py run_scheduler` instead.
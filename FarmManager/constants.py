@@ -246,3 +246,5 @@ class APIMessages:
     FAILED_TO_RECORD_MEDICAL_ASSESSMENT = "Failed to record medical assessment"
     FAILED_TO_RECORD_HEAT_MONITORING = "Failed to record heat sign monitoring"
     FAILED_TO_RECORD_BIRTH = "Failed to record birth event"
+    FARM_ALREADY_EXISTS = "Farm with ID {farm_id} already exists (possibly in the recycle bin/deleted items)."
+    COW_ALREADY_EXISTS = "Cow with ID {cow_id} already exists in this farm (possibly in the recycle bin/deleted items)."
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from FarmManager.models import (
+    Cow,
+    FarmerMedicalReport,
+    InseminationRecord,
+    MedicalAssessment,
+    Message,
+    Reproduction,
+)
+
+# Tables that are mostly read one farm at a time
+CLUSTERED_MODELS = (
+    Cow,
+    Message,
+    Reproduction,
+    MedicalAssessment,
+    InseminationRecord,
+    FarmerMedicalReport,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Physically reorders the per-farm tables by farm (PostgreSQL CLUSTER). "
+        "CLUSTER is not maintained on later writes and locks each table while "
+        "it runs, so schedule it off-peak (e.g. monthly from cron)."
+    )
+
+    def handle(self, *args, **kwargs):
+        if connection.vendor != "postgresql":
+            raise CommandError("cluster_tables requires PostgreSQL")
+
+        quote = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for model in CLUSTERED_MODELS:
+                table = model._meta.db_table
+                index = self.farm_index(cursor, table)
+                cursor.execute(f"CLUSTER {quote(table)} USING {quote(index)}")
+                cursor.execute(f"ANALYZE {quote(table)}")
+                self.stdout.write(f"Clustered {table} on {index}")
+
+    def farm_index(self, cursor, table):
+        """
+        Name of the plain farm_id index Django creates for the foreign key.
+        The (farm, -date) list indexes are partial, and PostgreSQL cannot
+        CLUSTER on a partial index.
+        """
+        constraints = connection.introspection.get_constraints(cursor, table)
+        for name, info in constraints.items():
+            if info["index"] and info["columns"] == ["farm_id"]:
+                return name
+        raise CommandError(f"No farm_id index found on {table}")
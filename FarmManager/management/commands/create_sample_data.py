@@ -8,6 +8,7 @@ from datetime import date, timedelta
 
 from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 
 from FarmManager.models import (BreedType, Cow, Doctor, Farm, FeedingFrequency,
@@ -33,16 +34,26 @@ class Command(BaseCommand):
             default=10,
             help="Number of cows per farm (default: 10)",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows per bulk INSERT (default: 1000)",
+        )
         parser.add_argument(
             "--clear",
             action="store_true",
             help="Clear existing data before creating new data",
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         num_farms = options["farms"]
         cows_per_farm = options["cows_per_farm"]
+        batch_size = options["batch_size"]
         clear_existing = options["clear"]
+        today = date.today()
+        now = timezone.now()
 
         if clear_existing:
             self.stdout.write(self.style.WARNING("Clearing existing data..."))
@@ -58,22 +69,26 @@ class Command(BaseCommand):
 
         call_command("populate_choices")
 
-        # Get choice model instances
-        housing_types = list(HousingType.objects.all())
-        floor_types = list(FloorType.objects.all())
-        water_sources = list(WaterSource.objects.all())
-        feeding_frequencies = list(FeedingFrequency.objects.all())
-        breed_types = list(BreedType.objects.all())
-        gynecological_statuses = list(GynecologicalStatus.objects.all())
+        # Get choice model pks (only the FK ids are needed to build rows)
+        housing_type_ids = tuple(HousingType.objects.values_list("pk", flat=True))
+        floor_type_ids = tuple(FloorType.objects.values_list("pk", flat=True))
+        water_source_ids = tuple(WaterSource.objects.values_list("pk", flat=True))
+        feeding_frequency_ids = tuple(
+            FeedingFrequency.objects.values_list("pk", flat=True)
+        )
+        breed_type_ids = tuple(BreedType.objects.values_list("pk", flat=True))
+        gynecological_status_ids = tuple(
+            GynecologicalStatus.objects.values_list("pk", flat=True)
+        )
 
         if not all(
             [
-                housing_types,
-                floor_types,
-                water_sources,
-                feeding_frequencies,
-                breed_types,
-                gynecological_statuses,
+                housing_type_ids,
+                floor_type_ids,
+                water_source_ids,
+                feeding_frequency_ids,
+                breed_type_ids,
+                gynecological_status_ids,
             ]
         ):
             self.stdout.write(
@@ -123,12 +138,12 @@ class Command(BaseCommand):
             doctors.append(doctor)
         self.stdout.write(self.style.SUCCESS(f"Created {len(doctors)} doctors"))
 
-        # Create Farms
+        # Build Farms (saved together with their cows below)
         self.stdout.write(f"Creating {num_farms} farms...")
         farms = []
         for i in range(num_farms):
-            farm = Farm.objects.create(
-                farm_id=f"FARM{str(i+1).zfill(3)}",
+            farm = Farm(
+                farm_id=f"FARM{i+1:03d}",
                 owner_name=f"Owner {i+1}",
                 address=f"Farm Address {i+1}, Addis Ababa, Ethiopia",
                 telephone_number=f"+25191234567{i}",
@@ -137,72 +152,101 @@ class Command(BaseCommand):
                 fertility_camp_no=(i % 5) + 1,
                 total_number_of_cows=cows_per_farm,
                 number_of_calves=random.randint(1, min(5, cows_per_farm // 2)),
-                number_of_milking_cows=random.randint(
-                    max(1, cows_per_farm - 3), max(1, cows_per_farm - 1)
-                ),
+                number_of_milking_cows=0,
                 total_daily_milk=random.randint(50, 200),
-                type_of_housing=random.choice(housing_types),
-                type_of_floor=random.choice(floor_types),
+                type_of_housing_id=random.choice(housing_type_ids),
+                type_of_floor_id=random.choice(floor_type_ids),
                 main_feed="Hay, Silage, Concentrate",
-                rate_of_cow_feeding=random.choice(feeding_frequencies),
-                source_of_water=random.choice(water_sources),
-                rate_of_water_giving=random.choice(feeding_frequencies),
+                rate_of_cow_feeding_id=random.choice(feeding_frequency_ids),
+                source_of_water_id=random.choice(water_source_ids),
+                rate_of_water_giving_id=random.choice(feeding_frequency_ids),
                 farm_hygiene_score=random.randint(1, 4),
                 inseminator=random.choice(inseminators) if inseminators else None,
                 doctor=random.choice(doctors) if doctors else None,
             )
             farms.append(farm)
-        self.stdout.write(self.style.SUCCESS(f"Created {len(farms)} farms"))
 
-        # Create Cows
+        # Build Cows and Reproduction records in memory
         self.stdout.write(f"Creating {cows_per_farm} cows per farm...")
-        total_cows = 0
+        total_cows = num_farms * cows_per_farm
+        breeds = random.choices(breed_type_ids, k=total_cows)
+        statuses = random.choices(gynecological_status_ids, k=total_cows)
+        body_weights = [random.uniform(300, 700) for _ in range(total_cows)]
+        bcs_scores = random.choices(
+            (1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0), k=total_cows
+        )
+        cows = []
+        reproductions = []
+        n = 0
         for farm in farms:
             for j in range(cows_per_farm):
                 # Calculate age (between 1 and 10 years)
                 age_years = random.randint(1, 10)
-                date_of_birth = date.today() - timedelta(
+                date_of_birth = today - timedelta(
                     days=age_years * 365 + random.randint(0, 365)
                 )
 
                 # Determine sex (mostly female for dairy farms)
                 sex = "F" if random.random() > 0.1 else "M"
 
-                cow = Cow.objects.create(
+                cow = Cow(
                     farm=farm,
-                    cow_id=f"{farm.farm_id}-COW{str(j+1).zfill(3)}",
-                    breed=random.choice(breed_types),
+                    cow_id=f"{farm.farm_id}-COW{j+1:03d}",
+                    breed_id=breeds[n],
                     date_of_birth=date_of_birth,
                     sex=sex,
                     parity=random.randint(0, 5) if sex == "F" else 0,
-                    body_weight=random.uniform(300, 700),
-                    bcs=random.choice([1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0]),
-                    gynecological_status=random.choice(gynecological_statuses),
+                    body_weight=body_weights[n],
+                    bcs=bcs_scores[n],
+                    gynecological_status_id=statuses[n],
                     lactation_number=random.randint(0, 5) if sex == "F" else 0,
                     days_in_milk=random.randint(0, 300) if sex == "F" else 0,
                     average_daily_milk=random.uniform(5, 25) if sex == "F" else 0,
                 )
-                total_cows += 1
+                cows.append(cow)
+                n += 1
+
+                # bulk_create skips the Cow post_save signal that keeps farm
+                # counts in sync, so track milking cows here instead
+                if cow.average_daily_milk > 0:
+                    farm.number_of_milking_cows += 1
 
                 # Create some reproduction records for female cows
                 if sex == "F" and random.random() > 0.3:
-                    Reproduction.objects.create(
-                        farm=farm,
-                        cow=cow,
-                        heat_signs_seen=str(random.choice([True, False])),
-                        heat_sign_start=timezone.now()
-                        - timedelta(days=random.randint(1, 30)),
-                        heat_sign_recorded_at=timezone.now()
-                        - timedelta(days=random.randint(1, 30)),
-                        is_cow_pregnant=random.choice([True, False]),
-                        pregnancy_date=(
-                            date.today() - timedelta(days=random.randint(1, 100))
-                            if random.random() > 0.5
-                            else None
-                        ),
+                    reproductions.append(
+                        Reproduction(
+                            farm=farm,
+                            cow=cow,
+                            heat_signs_seen=str(random.choice([True, False])),
+                            heat_sign_start=now - timedelta(days=random.randint(1, 30)),
+                            heat_sign_recorded_at=now
+                            - timedelta(days=random.randint(1, 30)),
+                            is_cow_pregnant=random.choice([True, False]),
+                            pregnancy_date=(
+                                today - timedelta(days=random.randint(1, 100))
+                                if random.random() > 0.5
+                                else None
+                            ),
+                        )
                     )
 
-        self.stdout.write(self.style.SUCCESS(f"Created {total_cows} cows"))
+        Farm.objects.bulk_create(farms, batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Created {len(farms)} farms"))
+
+        Cow.objects.bulk_create(cows, batch_size=batch_size)
+        if any(cow.pk is None for cow in cows):
+            # Backends such as MySQL don't return primary keys from bulk inserts
+            cow_pks = {
+                (farm_id, cow_id): pk
+                for pk, farm_id, cow_id in Cow.objects.filter(
+                    farm__in=farms
+                ).values_list("pk", "farm_id", "cow_id")
+            }
+            for cow in cows:
+                cow.pk = cow_pks[(cow.farm_id, cow.cow_id)]
+        self.stdout.write(self.style.SUCCESS(f"Created {len(cows)} cows"))
+
+        Reproduction.objects.bulk_create(reproductions, batch_size=batch_size)
 
         # Summary
         self.stdout.write(self.style.SUCCESS("\n" + "=" * 50))
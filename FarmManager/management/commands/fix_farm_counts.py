@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db.models import OuterRef
 
 from FarmManager.models import Cow, Farm
 
@@ -7,8 +8,8 @@ class Command(BaseCommand):
     help = "Recalculates total cow counts for all farms"
 
     def handle(self, *args, **kwargs):
-        for farm in Farm.objects.all():
-            count = Cow.objects.filter(farm=farm, is_deleted=False).count()
-            farm.total_number_of_cows = count
-            farm.save()
-            self.stdout.write(f"Updated Farm {farm.farm_id}: {count} cows")
+        farm_cows = Cow.objects.filter(farm=OuterRef("pk"))
+        updated = Farm.objects.update(
+            total_number_of_cows=farm_cows.correlated_count("farm")
+        )
+        self.stdout.write(f"Updated cow counts for {updated} farms")
@@ -1,14 +1,29 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from FarmManager.models import (BreedType, FeedingFrequency, FloorType,
                                 GeneralHealthStatus, GynecologicalStatus,
                                 HousingType, MastitisStatus, UdderHealthStatus,
                                 WaterSource)
+from FarmManager.services import ChoiceCacheService
+
+
+def _seed(model, pairs):
+    """
+    Insert the given (name, display_name) pairs, skipping existing names.
+    bulk_create sends no post_save, so the choice caches are cleared by hand.
+    """
+    model.objects.bulk_create(
+        [model(name=name, display_name=display_name) for name, display_name in pairs],
+        ignore_conflicts=True,
+    )
+    ChoiceCacheService.clear(model)
 
 
 class Command(BaseCommand):
     help = "Populate choice models with initial data"
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         # Housing Types
         housing_types = [
@@ -16,8 +31,7 @@ class Command(BaseCommand):
             ("tiestall", "Tie Stall"),
             ("traditional", "Traditional"),
         ]
-        for name, display_name in housing_types:
-            HousingType.objects.get_or_create(name=name, display_name=display_name)
+        _seed(HousingType, housing_types)
         self.stdout.write(self.style.SUCCESS("Successfully created housing types"))
 
         # Floor Types
@@ -27,8 +41,7 @@ class Command(BaseCommand):
             ("soil", "Soil"),
             ("mat_bedding", "Mat/Other Bedding"),
         ]
-        for name, display_name in floor_types:
-            FloorType.objects.get_or_create(name=name, display_name=display_name)
+        _seed(FloorType, floor_types)
         self.stdout.write(self.style.SUCCESS("Successfully created floor types"))
 
         # Water Sources
@@ -36,8 +49,7 @@ class Command(BaseCommand):
             ("tap_water", "Tap Water"),
             ("wells", "Wells"),
         ]
-        for name, display_name in water_sources:
-            WaterSource.objects.get_or_create(name=name, display_name=display_name)
+        _seed(WaterSource, water_sources)
         self.stdout.write(self.style.SUCCESS("Successfully created water sources"))
 
         # Feeding Frequencies
@@ -46,8 +58,7 @@ class Command(BaseCommand):
             ("twice", "Twice Daily"),
             ("thrice", "Three Times Daily"),
         ]
-        for name, display_name in feeding_frequencies:
-            FeedingFrequency.objects.get_or_create(name=name, display_name=display_name)
+        _seed(FeedingFrequency, feeding_frequencies)
         self.stdout.write(
             self.style.SUCCESS("Successfully created feeding frequencies")
         )
@@ -59,8 +70,7 @@ class Command(BaseCommand):
             ("hf_zebu_cross", "HF*Zebu Cross"),
             ("other", "Other"),
         ]
-        for name, display_name in breed_types:
-            BreedType.objects.get_or_create(name=name, display_name=display_name)
+        _seed(BreedType, breed_types)
         self.stdout.write(self.style.SUCCESS("Successfully created breed types"))
 
         # Gynecological Status
@@ -72,10 +82,7 @@ class Command(BaseCommand):
             ("fresh", "Fresh"),
             ("birth", "Birth"),
         ]
-        for name, display_name in gynecological_statuses:
-            GynecologicalStatus.objects.get_or_create(
-                name=name, display_name=display_name
-            )
+        _seed(GynecologicalStatus, gynecological_statuses)
         self.stdout.write(
             self.style.SUCCESS("Successfully created gynecological statuses")
         )
@@ -87,10 +94,7 @@ class Command(BaseCommand):
             ("2qt_normal", "2qt Normal"),
             ("1qt_normal", "1qt Normal"),
         ]
-        for name, display_name in udder_health_statuses:
-            UdderHealthStatus.objects.get_or_create(
-                name=name, display_name=display_name
-            )
+        _seed(UdderHealthStatus, udder_health_statuses)
         self.stdout.write(
             self.style.SUCCESS("Successfully created udder health statuses")
         )
@@ -103,8 +107,7 @@ class Command(BaseCommand):
             ("cmt_plus_plus", "CMT ++"),
             ("cmt_plus_plus_plus", "CMT +++"),
         ]
-        for name, display_name in mastitis_statuses:
-            MastitisStatus.objects.get_or_create(name=name, display_name=display_name)
+        _seed(MastitisStatus, mastitis_statuses)
         self.stdout.write(self.style.SUCCESS("Successfully created mastitis statuses"))
 
         # General Health Status
@@ -112,10 +115,7 @@ class Command(BaseCommand):
             ("normal", "Normal"),
             ("sick", "Sick"),
         ]
-        for name, display_name in general_health_statuses:
-            GeneralHealthStatus.objects.get_or_create(
-                name=name, display_name=display_name
-            )
+        _seed(GeneralHealthStatus, general_health_statuses)
         self.stdout.write(
             self.style.SUCCESS("Successfully created general health statuses")
         )
@@ -0,0 +1,21 @@
+"""
+Management command to run the daily alert scheduler in a dedicated process
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Run the daily heat sign and calving alert scheduler (blocks until stopped)"
+
+    def handle(self, *args, **options):
+        from AlertSystem import updater
+
+        self.stdout.write(
+            self.style.SUCCESS("Starting daily alert scheduler. Press Ctrl+C to stop.")
+        )
+
+        try:
+            updater.start()
+        except (KeyboardInterrupt, SystemExit):
+            self.stdout.write(self.style.WARNING("Scheduler stopped"))
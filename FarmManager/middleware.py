@@ -8,8 +8,6 @@ This module provides middleware for:
 """
 
 import logging
-import signal
-import threading
 import time
 
 from django.conf import settings
@@ -18,6 +16,18 @@ from django.http import JsonResponse
 
 logger = logging.getLogger(__name__)
 
+# Settings are resolved once at import rather than per middleware instance
+REQUEST_TIMEOUT = getattr(settings, "REQUEST_TIMEOUT", 30)
+ENABLE_REQUEST_TIMEOUT = getattr(settings, "ENABLE_REQUEST_TIMEOUT", True)
+ENABLE_QUERY_COUNT_LOGGING = getattr(settings, "DEBUG", False) or getattr(
+    settings, "ENABLE_QUERY_COUNT_LOGGING", False
+)
+QUERY_COUNT_WARNING_THRESHOLD = getattr(settings, "QUERY_COUNT_WARNING_THRESHOLD", 20)
+SLOW_REQUEST_THRESHOLD = getattr(settings, "SLOW_REQUEST_THRESHOLD", 2.0)
+
+# Requests under these paths are passed straight through (no timing/timeout)
+UNMONITORED_PATH_PREFIXES = ("/admin/", "/static/", "/media/")
+
 
 class TimeoutException(Exception):
     """Exception raised when a request times out"""
@@ -25,9 +35,16 @@ class TimeoutException(Exception):
     pass
 
 
-def timeout_handler(signum, frame):
-    """Handler for timeout signal"""
-    raise TimeoutException("Request processing timed out")
+def check_deadline(request):
+    """
+    Raise TimeoutException if the request has run past its deadline.
+
+    Long-running views should call this between units of work; requests
+    without a deadline (timeouts disabled, admin/static paths) never raise.
+    """
+    deadline = getattr(request, "_deadline", None)
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutException("Request processing timed out")
 
 
 class RequestTimeoutMiddleware:
@@ -37,63 +54,45 @@ class RequestTimeoutMiddleware:
     Prevents requests from running indefinitely and consuming server resources.
     Default timeout: 30 seconds (configurable via settings.REQUEST_TIMEOUT)
 
-    Note: This uses signal.SIGALRM which only works on Unix-based systems.
-    For Windows or production with Gunicorn, rely on server-level timeouts.
+    Each request gets a deadline (request._deadline) that views enforce
+    cooperatively via check_deadline(). This works on any platform and in
+    threaded workers; hard limits are left to the server (Gunicorn timeout).
     """
 
+    __slots__ = ("get_response", "timeout", "enabled")
+
     def __init__(self, get_response):
         self.get_response = get_response
-        # Get timeout from settings, default to 30 seconds
-        self.timeout = getattr(settings, "REQUEST_TIMEOUT", 30)
-        self.enabled = getattr(settings, "ENABLE_REQUEST_TIMEOUT", True)
+        self.timeout = REQUEST_TIMEOUT
+        self.enabled = ENABLE_REQUEST_TIMEOUT
 
     def __call__(self, request):
-        # Only enable on Unix-based systems and main thread
-        if (
-            not self.enabled
-            or not hasattr(signal, "SIGALRM")
-            or threading.current_thread() is not threading.main_thread()
-        ):
+        if not self.enabled:
             return self.get_response(request)
 
-        # Don't timeout admin or static requests
-        if request.path.startswith("/admin/") or request.path.startswith("/static/"):
+        # Don't timeout admin, static or media requests
+        if request.path.startswith(UNMONITORED_PATH_PREFIXES):
             return self.get_response(request)
 
-        # Set the timeout
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(self.timeout)
-
-        try:
-            response = self.get_response(request)
-            # Cancel the alarm
-            signal.alarm(0)
-            return response
-
-        except TimeoutException:
-            # Request timed out
-            signal.alarm(0)  # Cancel the alarm
-            logger.error(
-                f"Request timeout: {request.method} {request.path} exceeded {self.timeout}s"
-            )
+        request._deadline = time.monotonic() + self.timeout
+        return self.get_response(request)
 
-            return JsonResponse(
-                {
-                    "error": "Request timeout",
-                    "detail": f"Request took longer than {self.timeout} seconds to process",
-                    "status": "timeout",
-                },
-                status=504,
-            )  # Gateway Timeout
+    def process_exception(self, request, exception):
+        if not isinstance(exception, TimeoutException):
+            return None
 
-        except Exception as e:
-            # Other exception - make sure to cancel alarm
-            signal.alarm(0)
-            raise
+        logger.error(
+            f"Request timeout: {request.method} {request.path} exceeded {self.timeout}s"
+        )
 
-        finally:
-            # Ensure alarm is always cancelled
-            signal.alarm(0)
+        return JsonResponse(
+            {
+                "error": "Request timeout",
+                "detail": f"Request took longer than {self.timeout} seconds to process",
+                "status": "timeout",
+            },
+            status=504,
+        )  # Gateway Timeout
 
 
 class QueryCountDebugMiddleware:
@@ -104,32 +103,38 @@ class QueryCountDebugMiddleware:
     Only enable in development or when debugging performance issues.
     """
 
+    __slots__ = ("get_response", "enabled", "warning_threshold")
+
     def __init__(self, get_response):
         self.get_response = get_response
-        # Only enable if DEBUG is True or explicitly enabled
-        self.enabled = getattr(settings, "DEBUG", False) or getattr(
-            settings, "ENABLE_QUERY_COUNT_LOGGING", False
-        )
+        # Only enabled if DEBUG is True or explicitly enabled
+        self.enabled = ENABLE_QUERY_COUNT_LOGGING
         # Threshold for warning logs (default: 20 queries)
-        self.warning_threshold = getattr(settings, "QUERY_COUNT_WARNING_THRESHOLD", 20)
+        self.warning_threshold = QUERY_COUNT_WARNING_THRESHOLD
+        if self.enabled and not settings.DEBUG:
+            # Django only records queries when DEBUG is on
+            logger.warning(
+                "ENABLE_QUERY_COUNT_LOGGING is set without DEBUG; "
+                "query counts will always be 0"
+            )
 
     def __call__(self, request):
-        if not self.enabled:
+        if not self.enabled or request.path.startswith(UNMONITORED_PATH_PREFIXES):
             return self.get_response(request)
 
         # Reset query log
-        if hasattr(connection, "queries_log"):
+        if connection.queries_log:
             connection.queries_log.clear()
 
         # Track timing
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Process request
         response = self.get_response(request)
 
         # Calculate metrics
-        duration = time.time() - start_time
-        query_count = len(connection.queries)
+        duration = time.perf_counter() - start_time
+        query_count = len(connection.queries_log)
 
         # Log results
         if query_count > self.warning_threshold:
@@ -157,19 +162,24 @@ class PerformanceMonitoringMiddleware:
     Logs slow requests and can be extended to send metrics to monitoring services.
     """
 
+    __slots__ = ("get_response", "slow_threshold")
+
     def __init__(self, get_response):
         self.get_response = get_response
         # Threshold for slow request warnings (default: 2 seconds)
-        self.slow_threshold = getattr(settings, "SLOW_REQUEST_THRESHOLD", 2.0)
+        self.slow_threshold = SLOW_REQUEST_THRESHOLD
 
     def __call__(self, request):
-        start_time = time.time()
+        if request.path.startswith(UNMONITORED_PATH_PREFIXES):
+            return self.get_response(request)
+
+        start_time = time.perf_counter()
 
         # Process request
         response = self.get_response(request)
 
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Log slow requests
         if duration > self.slow_threshold:
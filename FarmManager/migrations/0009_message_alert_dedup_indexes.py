@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:28
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Message is large; its indexes are built with CREATE INDEX
+    # CONCURRENTLY, which cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("FarmManager", "0008_add_cluster_number_to_farm"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="farm",
+            options={"ordering": ["farm_id"]},
+        ),
+        AddIndexConcurrently(
+            model_name="message",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["message_type", "sent_date"],
+                name="message_type_sent_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="message",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["farm", "cow", "message_type", "sent_date"],
+                name="message_farm_cow_type_idx",
+            ),
+        ),
+    ]
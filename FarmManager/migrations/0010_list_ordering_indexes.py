@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Message and Reproduction are large; their indexes are built with
+    # CREATE INDEX CONCURRENTLY, which cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("FarmManager", "0009_message_alert_dedup_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="farmermedicalreport",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["farm", "-reported_date"],
+                name="farmer_report_farm_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="farmermedicalreport",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["cow", "-reported_date"],
+                name="farmer_report_cow_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inseminationrecord",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["farm", "-recorded_date"],
+                name="insemination_farm_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inseminationrecord",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["cow", "-recorded_date"],
+                name="insemination_cow_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicalassessment",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["farm", "-assessment_date"],
+                name="assessment_farm_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicalassessment",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["cow", "-assessment_date"],
+                name="assessment_cow_date_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="message",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["farm", "-sent_date"],
+                name="message_farm_sent_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="message",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["cow", "-sent_date"],
+                name="message_cow_sent_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="reproduction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["farm", "-heat_sign_recorded_at"],
+                name="repro_farm_recorded_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="reproduction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["cow", "-heat_sign_recorded_at"],
+                name="repro_cow_recorded_idx",
+            ),
+        ),
+    ]
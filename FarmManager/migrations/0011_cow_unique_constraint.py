@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("FarmManager", "0010_list_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="cow",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="cow",
+            constraint=models.UniqueConstraint(
+                fields=("farm", "cow_id"), name="cow_unique_per_farm"
+            ),
+        ),
+    ]
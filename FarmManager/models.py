@@ -1,13 +1,63 @@
 from django.core.validators import (MaxValueValidator, MinValueValidator,
                                     RegexValidator)
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 
+# Soft-deleted rows are never read through the default managers, so indexes
+# serving list endpoints only need to cover live rows (partial indexes)
+LIVE_ROWS = models.Q(is_deleted=False)
+
+# Shared by Farm.telephone_number and StaffMember.phone_number
+PHONE_VALIDATOR = RegexValidator(
+    regex=r"^\+?1?\d{9,15}$",
+    message=_("Enter a valid phone number (e.g. +251912345678 or 0912345678)"),
+)
+
+FARM_HYGIENE_CHOICES = [(i, str(i)) for i in range(1, 5)]
+BCS_CHOICES = [(x / 2, str(x / 2)) for x in range(2, 11)]  # 1.0 to 5.0 in 0.5 steps
+
+
 # --- Base Models for Common Patterns ---
-class SoftDeleteManager(models.Manager):
+class SoftDeleteQuerySet(models.QuerySet):
+    def with_related(self):
+        """Join the foreign keys listed in the model's default_related."""
+        return self.select_related(*self.model.default_related)
+
+    def list_fields(self):
+        """
+        with_related(), loading only the related columns named in the
+        model's list_related_fields (what list serializers render).
+        """
+        related = self.model.list_related_fields
+        if not related:
+            return self.with_related()
+        local = [field.name for field in self.model._meta.concrete_fields]
+        return self.with_related().only(*local, *related)
+
+    def correlated_count(self, group_by):
+        """
+        Subquery expression counting the rows of the queryset (0 if none),
+        for a queryset filtered on an OuterRef through the group_by field,
+        e.g. Cow.objects.filter(farm=OuterRef("pk")).correlated_count("farm")
+        """
+        counts = self.order_by().values(group_by).annotate(count=models.Count("pk"))
+        return Coalesce(models.Subquery(counts.values("count")), 0)
+
+    def soft_delete(self):
+        """
+        Flag every row in the queryset as deleted with a single UPDATE.
+        Like QuerySet.update(), this skips save() and signals, so derived
+        data (e.g. Farm cow counts) is not refreshed.
+        """
+        return self.update(is_deleted=True)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
     def get_queryset(self):
-        return super().get_queryset().filter(is_deleted=False)
+        # Same predicate as the partial indexes, so the planner can use them
+        return super().get_queryset().filter(LIVE_ROWS)
 
     def all_with_deleted(self):
         return super().get_queryset()
@@ -20,12 +70,17 @@ class SoftDeleteModel(models.Model):
     is_deleted = models.BooleanField(default=False)
     objects = SoftDeleteManager()
 
+    # Foreign keys joined by with_related(), i.e. those read by serializers
+    default_related = ()
+    # Related columns list endpoints read; list_fields() defers the rest
+    list_related_fields = ()
+
     class Meta:
         abstract = True
 
     def delete(self, *args, **kwargs):
         self.is_deleted = True
-        self.save()
+        self.save(update_fields=["is_deleted"])
 
     def hard_delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
@@ -82,21 +137,31 @@ class GeneralHealthStatus(BaseChoiceModel):
 
 # --- Main Models ---
 class Farm(SoftDeleteModel):
-    FARM_HYGIENE_CHOICES = [(i, str(i)) for i in range(1, 5)]
+    default_related = (
+        "type_of_housing",
+        "type_of_floor",
+        "source_of_water",
+        "rate_of_cow_feeding",
+        "rate_of_water_giving",
+        "inseminator",
+        "doctor",
+    )
+    list_related_fields = (
+        "type_of_housing__display_name",
+        "type_of_floor__display_name",
+        "source_of_water__display_name",
+        "rate_of_cow_feeding__display_name",
+        "rate_of_water_giving__display_name",
+        "inseminator__name",
+        "doctor__name",
+    )
 
     farm_id = models.CharField(max_length=50, primary_key=True)
     owner_name = models.CharField(max_length=255)
     address = models.TextField()
     telephone_number = models.CharField(
         max_length=15,
-        validators=[
-            RegexValidator(
-                regex=r"^\+?1?\d{9,15}$",
-                message=_(
-                    "Enter a valid phone number (e.g. +251912345678 or 0912345678)"
-                ),
-            )
-        ],
+        validators=[PHONE_VALIDATOR],
     )
     location_gps = models.CharField(max_length=255, blank=True, null=True)
     cluster_number = models.CharField(
@@ -170,11 +235,10 @@ class Farm(SoftDeleteModel):
     def clean(self):
         from django.core.exceptions import ValidationError
 
-        # Check for duplicates including soft-deleted records
+        # Check for duplicates including soft-deleted records. farm_id is the
+        # primary key, so only new farms can collide (one pk lookup).
         qs = Farm.objects.all_with_deleted().filter(farm_id=self.farm_id)
-        if self.pk:
-            qs = qs.exclude(pk=self.pk)
-        if qs.exists():
+        if self._state.adding and qs.exists():
             raise ValidationError(
                 {
                     "farm_id": _(
@@ -197,6 +261,13 @@ class Cow(SoftDeleteModel):
         FEMALE = "F", _("Female")
         MALE = "M", _("Male")
 
+    default_related = ("farm", "breed", "gynecological_status")
+    list_related_fields = (
+        "farm__owner_name",
+        "breed__display_name",
+        "gynecological_status__display_name",
+    )
+
     farm = models.ForeignKey(Farm, on_delete=models.CASCADE, related_name="cows")
     cow_id = models.CharField(max_length=50)
     breed = models.ForeignKey(BreedType, on_delete=models.PROTECT, related_name="cows")
@@ -215,9 +286,7 @@ class Cow(SoftDeleteModel):
     bcs = models.DecimalField(
         max_digits=2,
         decimal_places=1,
-        choices=[
-            (x / 2, str(x / 2)) for x in range(2, 11)
-        ],  # 1.0 to 5.0 in 0.5 increments
+        choices=BCS_CHOICES,
         verbose_name=_("Body Condition Score"),
     )
     gynecological_status = models.ForeignKey(
@@ -239,14 +308,21 @@ class Cow(SoftDeleteModel):
     last_calving_date = models.DateField(null=True, blank=True)
 
     class Meta:
-        unique_together = ("farm", "cow_id")
         ordering = ["farm", "cow_id"]
+        constraints = [
+            # Covers soft-deleted rows too, so duplicates fail at INSERT time
+            models.UniqueConstraint(
+                fields=["farm", "cow_id"], name="cow_unique_per_farm"
+            ),
+        ]
 
     def clean(self):
         from django.core.exceptions import ValidationError
 
         # Check for duplicates including soft-deleted records
-        qs = Cow.objects.all_with_deleted().filter(farm=self.farm, cow_id=self.cow_id)
+        qs = Cow.objects.all_with_deleted().filter(
+            farm_id=self.farm_id, cow_id=self.cow_id
+        )
         if self.pk:
             qs = qs.exclude(pk=self.pk)
         if qs.exists():
@@ -260,14 +336,16 @@ class Cow(SoftDeleteModel):
         super().clean()
 
     def __str__(self):
-        return f"Farm {self.farm.farm_id} - Cow {self.cow_id}"
+        return f"Farm {self.farm_id} - Cow {self.cow_id}"
 
     @property
     def full_id(self):
-        return f"{self.farm.farm_id}_{self.cow_id}"
+        return f"{self.farm_id}_{self.cow_id}"
 
 
 class Reproduction(SoftDeleteModel):
+    default_related = ("farm", "cow")
+
     farm = models.ForeignKey(
         Farm, on_delete=models.CASCADE, related_name="reproductions"
     )
@@ -295,6 +373,18 @@ class Reproduction(SoftDeleteModel):
         ordering = [
             "-heat_sign_recorded_at"
         ]  # Order by most recent heat sign records first
+        indexes = [
+            models.Index(
+                fields=["farm", "-heat_sign_recorded_at"],
+                name="repro_farm_recorded_idx",
+                condition=LIVE_ROWS,
+            ),
+            models.Index(
+                fields=["cow", "-heat_sign_recorded_at"],
+                name="repro_cow_recorded_idx",
+                condition=LIVE_ROWS,
+            ),
+        ]
 
 
 class Message(SoftDeleteModel):
@@ -311,6 +401,8 @@ class Message(SoftDeleteModel):
         PREGNANCY_CONFIRMATION = "pregnancy_confirmation", _("Pregnancy Confirmation")
         OTHER = "other", _("Other")
 
+    default_related = ("farm", "cow")
+
     farm = models.ForeignKey(Farm, on_delete=models.CASCADE, related_name="messages")
     cow = models.ForeignKey(
         Cow, on_delete=models.CASCADE, related_name="messages", null=True, blank=True
@@ -321,10 +413,34 @@ class Message(SoftDeleteModel):
     is_sent = models.BooleanField(default=False)
 
     def __str__(self):
-        return f"Message for Farm {self.farm.farm_id} - Cow {self.cow.cow_id}"
+        return f"Message for Farm {self.farm_id} - Cow {self.cow.cow_id}"
 
     class Meta:
         ordering = ["-sent_date"]
+        indexes = [
+            # Recent-alert dedup lookups in AlertSystem.updater
+            models.Index(
+                fields=["message_type", "sent_date"],
+                name="message_type_sent_idx",
+                condition=LIVE_ROWS,
+            ),
+            models.Index(
+                fields=["farm", "cow", "message_type", "sent_date"],
+                name="message_farm_cow_type_idx",
+                condition=LIVE_ROWS,
+            ),
+            # Per-farm / per-cow message lists, newest first
+            models.Index(
+                fields=["farm", "-sent_date"],
+                name="message_farm_sent_idx",
+                condition=LIVE_ROWS,
+            ),
+            models.Index(
+                fields=["cow", "-sent_date"],
+                name="message_cow_sent_idx",
+                condition=LIVE_ROWS,
+            ),
+        ]
 
 
 class StaffMember(SoftDeleteModel):
@@ -334,14 +450,7 @@ class StaffMember(SoftDeleteModel):
     name = models.CharField(max_length=255)
     phone_number = models.CharField(
         max_length=15,
-        validators=[
-            RegexValidator(
-                regex=r"^\+?1?\d{9,15}$",
-                message=_(
-                    "Enter a valid phone number (e.g. +251912345678 or 0912345678)"
-                ),
-            )
-        ],
+        validators=[PHONE_VALIDATOR],
     )
     address = models.TextField()
     is_active = models.BooleanField(default=True)
@@ -367,6 +476,8 @@ class Doctor(StaffMember):
 
 
 class FarmerMedicalReport(SoftDeleteModel):
+    default_related = ("farm", "cow", "reviewed_by")
+
     farm = models.ForeignKey(
         Farm, on_delete=models.CASCADE, related_name="farmer_medical_reports"
     )
@@ -382,10 +493,22 @@ class FarmerMedicalReport(SoftDeleteModel):
     review_date = models.DateTimeField(null=True, blank=True)
 
     def __str__(self):
-        return f"Medical Report - Farm {self.farm.farm_id} - Cow {self.cow.cow_id}"
+        return f"Medical Report - Farm {self.farm_id} - Cow {self.cow.cow_id}"
 
     class Meta:
         ordering = ["-reported_date"]
+        indexes = [
+            models.Index(
+                fields=["farm", "-reported_date"],
+                name="farmer_report_farm_date_idx",
+                condition=LIVE_ROWS,
+            ),
+            models.Index(
+                fields=["cow", "-reported_date"],
+                name="farmer_report_cow_date_idx",
+                condition=LIVE_ROWS,
+            ),
+        ]
 
 
 class MedicalAssessment(SoftDeleteModel):
@@ -393,6 +516,15 @@ class MedicalAssessment(SoftDeleteModel):
         INFECTIOUS = "infectious", _("Infectious Disease")
         NON_INFECTIOUS = "non_infectious", _("Non-Infectious Disease")
 
+    default_related = (
+        "farm",
+        "cow",
+        "assessed_by",
+        "general_health",
+        "udder_health",
+        "mastitis",
+    )
+
     farm = models.ForeignKey(
         Farm, on_delete=models.CASCADE, related_name="medical_assessments"
     )
@@ -437,13 +569,27 @@ class MedicalAssessment(SoftDeleteModel):
     notes = models.TextField(blank=True)
 
     def __str__(self):
-        return f"Medical Assessment - Farm {self.farm.farm_id} - Cow {self.cow.cow_id}"
+        return f"Medical Assessment - Farm {self.farm_id} - Cow {self.cow.cow_id}"
 
     class Meta:
         ordering = ["-assessment_date"]
+        indexes = [
+            models.Index(
+                fields=["farm", "-assessment_date"],
+                name="assessment_farm_date_idx",
+                condition=LIVE_ROWS,
+            ),
+            models.Index(
+                fields=["cow", "-assessment_date"],
+                name="assessment_cow_date_idx",
+                condition=LIVE_ROWS,
+            ),
+        ]
 
 
 class InseminationRecord(SoftDeleteModel):
+    default_related = ("farm", "cow", "inseminator")
+
     farm = models.ForeignKey(
         Farm, on_delete=models.CASCADE, related_name="insemination_records"
     )
@@ -460,7 +606,19 @@ class InseminationRecord(SoftDeleteModel):
     recorded_date = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"Insemination Record - Farm {self.farm.farm_id} - Cow {self.cow.cow_id}"
+        return f"Insemination Record - Farm {self.farm_id} - Cow {self.cow.cow_id}"
 
     class Meta:
         ordering = ["-recorded_date"]
+        indexes = [
+            models.Index(
+                fields=["farm", "-recorded_date"],
+                name="insemination_farm_date_idx",
+                condition=LIVE_ROWS,
+            ),
+            models.Index(
+                fields=["cow", "-recorded_date"],
+                name="insemination_cow_date_idx",
+                condition=LIVE_ROWS,
+            ),
+        ]
@@ -4,10 +4,153 @@ Custom pagination classes for FarmManager API
 This module provides flexible pagination options for API endpoints.
 """
 
-from rest_framework.pagination import PageNumberPagination
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Count, QuerySet, Window
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
+class WindowCountPaginator(Paginator):
+    """
+    Paginator that fetches a page and the total count in one SELECT, by
+    annotating the page rows with COUNT(*) OVER () instead of running a
+    separate COUNT(*) query first.
+
+    An empty first page means a total of zero. Past the last page there is
+    no row to carry the total, so it falls back to the regular COUNT (as it
+    does for plain lists, DISTINCT querysets and paginators with orphans).
+    """
+
+    total_annotation = "window_total_count"
+
+    def page(self, number):
+        queryset = self.object_list
+        if (
+            "count" in self.__dict__
+            or not isinstance(queryset, QuerySet)
+            or queryset.query.distinct
+            or self.orphans
+        ):
+            return super().page(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return super().page(number)
+        if number < 1:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(
+            queryset.annotate(**{self.total_annotation: Window(expression=Count("*"))})[
+                bottom : bottom + self.per_page
+            ]
+        )
+        if rows:
+            first = rows[0]
+            if isinstance(first, dict):  # QuerySet.values() rows
+                self.count = first[self.total_annotation]
+            else:
+                self.count = getattr(first, self.total_annotation)
+        elif number == 1:
+            self.count = 0
+        else:
+            return super().page(number)
+        return self._get_page(rows, number, self)
+
+
+class LookaheadPage(Page):
+    """
+    Page that knows whether a next page exists from the rows it fetched,
+    not from the paginator's count (which may be an estimate).
+    """
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.paginator.per_page * (self.number - 1)) + 1
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1 if self.object_list else 0
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large tables that never counts them in full.
+
+    On PostgreSQL, when the planner statistics (pg_class.reltuples) put the
+    model's table above estimate_threshold rows, count reports that
+    estimate: it covers the whole table, not the queryset's filters, and is
+    only as fresh as the last ANALYZE. Smaller tables get an exact COUNT.
+
+    Because the count may be off, it is not used to validate pages or to
+    find the last one: each page fetches per_page + 1 rows to learn whether
+    a next page exists, and an empty page past the first is the 404.
+    """
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_table_rows()
+        if estimate is not None and estimate > self.estimate_threshold:
+            return estimate
+        return super().count
+
+    def estimated_table_rows(self):
+        """
+        The planner's row estimate for the queryset's table, or None when it
+        is unknown (not PostgreSQL, not a queryset, never analyzed)
+        """
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class"
+                " WHERE relname = %s AND pg_table_is_visible(oid)",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (0 before PostgreSQL 14) until the first ANALYZE
+        if row is None or row[0] <= 0:
+            return None
+        return int(row[0])
+
+    def validate_number(self, number):
+        """Validate the page number without checking it against the count"""
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return LookaheadPage(
+            rows[: self.per_page], number, self, has_next=len(rows) > self.per_page
+        )
+
+
 class StandardResultsSetPagination(PageNumberPagination):
     """
     Standard pagination class with configurable page size.
@@ -18,6 +161,7 @@ class StandardResultsSetPagination(PageNumberPagination):
     Clients can specify page size using ?page_size=N query parameter
     """
 
+    django_paginator_class = WindowCountPaginator
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -39,15 +183,19 @@ class StandardResultsSetPagination(PageNumberPagination):
         )
 
 
-class LargeResultsSetPagination(PageNumberPagination):
+class LargeResultsSetPagination(StandardResultsSetPagination):
     """
     Pagination for large datasets (e.g., messages, medical records)
 
-    Default: 100 items per page
+    Default: 50 items per page, as with the standard pagination
     Max: 500 items per page
+
+    Large tables report an estimated count (see EstimatedCountPaginator), so
+    a page costs the same whatever the table size.
     """
 
-    page_size = 100
+    django_paginator_class = EstimatedCountPaginator
+    page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 500
 
@@ -63,3 +211,44 @@ class SmallResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 50
+
+
+class TimestampCursorPagination(CursorPagination):
+    """
+    Cursor pagination for time-ordered feeds (messages, medical records)
+
+    Pages are selected with a range condition on the model's ordering column
+    (e.g. sent_date < cursor) instead of OFFSET, so a deep page costs the
+    same as the first one. Ordering comes from the model's Meta.ordering.
+
+    Default: 100 items per page
+    Max: 500 items per page
+    """
+
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(queryset.model._meta.ordering)
+
+
+class OptionalCursorPaginationMixin:
+    """
+    ViewSet mixin that switches to cursor_pagination_class when the request
+    carries the cursor parameter. Clients opt in with ?cursor= for the first
+    page and follow the returned next/previous links; requests without it
+    keep the view's regular page-number pagination.
+    """
+
+    cursor_pagination_class = TimestampCursorPagination
+
+    @property
+    def paginator(self):
+        cursor_param = self.cursor_pagination_class.cursor_query_param
+        if (
+            not hasattr(self, "_paginator")
+            and cursor_param in self.request.query_params
+        ):
+            self._paginator = self.cursor_pagination_class()
+        return super().paginator
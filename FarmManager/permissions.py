@@ -24,14 +24,8 @@ class AdminGetOnlyPermission(permissions.BasePermission):
         return True
 
     def has_object_permission(self, request, view, obj):
-        # For GET requests on specific objects, require admin authentication
-        if request.method == "GET":
-            return (
-                request.user and request.user.is_authenticated and request.user.is_staff
-            )
-
-        # For all other methods, allow access
-        return True
+        # Access never depends on the object itself; same rule as above
+        return self.has_permission(request, view)
 
 
 class ReadOnlyAdminPermission(permissions.BasePermission):
@@ -10,6 +10,8 @@ import os
 from uuid import uuid4
 
 import django
+from django.db import transaction
+from django.db.models import Q
 
 # Configure logging
 logging.basicConfig(
@@ -29,10 +31,10 @@ def update_farm_ids():
     try:
         from .models import Farm
 
-        farms_without_id = Farm.objects.filter(
-            farm_id__isnull=True
-        ) | Farm.objects.filter(farm_id="")
-        total_farms = farms_without_id.count()
+        farms_without_id = list(
+            Farm.objects.filter(Q(farm_id__isnull=True) | Q(farm_id=""))
+        )
+        total_farms = len(farms_without_id)
 
         if total_farms == 0:
             logger.info("No farms found without farm_id. All farms already have IDs.")
@@ -40,13 +42,16 @@ def update_farm_ids():
 
         logger.info(f"Found {total_farms} farms without farm_id. Updating...")
 
+        # farm_id is the primary key, which bulk_update() refuses to touch,
+        # so rows are still saved one by one but committed together
         updated_count = 0
-        for farm in farms_without_id:
-            old_id = farm.farm_id
-            farm.farm_id = str(uuid4())
-            farm.save()
-            logger.info(f"Updated farm: {old_id or 'None'} -> {farm.farm_id}")
-            updated_count += 1
+        with transaction.atomic():
+            for farm in farms_without_id:
+                old_id = farm.farm_id
+                farm.farm_id = str(uuid4())
+                farm.save()
+                logger.info(f"Updated farm: {old_id or 'None'} -> {farm.farm_id}")
+                updated_count += 1
 
         logger.info(f"Successfully updated {updated_count} farms with new farm_ids.")
 
@@ -9,22 +9,44 @@ It has been refactored to use:
 - Better error handling and logging
 """
 
+import copy
 import logging
-from datetime import datetime
+import operator
+import re
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 
-from django.db import models
+from django.core.exceptions import FieldDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models.manager import BaseManager
 from rest_framework import serializers
-
-from .models import (BreedType, Cow, Doctor, Farm, FarmerMedicalReport,
-                     FeedingFrequency, FloorType, GeneralHealthStatus,
-                     GynecologicalStatus, HousingType, InseminationRecord,
-                     Inseminator, MastitisStatus, MedicalAssessment, Message,
-                     Reproduction, UdderHealthStatus, WaterSource)
-from .services import LoggingMixin, ValidationService
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject, RelatedField
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueValidator
+
+from .constants import APIMessages
+from .models import (BCS_CHOICES, BaseChoiceModel, BreedType, Cow, Doctor,
+                     Farm, FarmerMedicalReport, FeedingFrequency, FloorType,
+                     GeneralHealthStatus, GynecologicalStatus, HousingType,
+                     InseminationRecord, Inseminator, MastitisStatus,
+                     MedicalAssessment, Message, Reproduction,
+                     UdderHealthStatus, WaterSource)
+from .services import ChoiceCacheService, LoggingMixin, ValidationService
 
 logger = logging.getLogger(__name__)
 
+# Valid BCS values (1.0 to 5.0 in 0.5 steps) as the Decimals Cow.bcs stores
+BCS_DECIMALS = {value: Decimal(str(value)) for value, _ in BCS_CHOICES}
+
+# Answers treated as "yes" by the yes/no fields of the cow form
+YES_VALUES = frozenset({"yes", "y", "true", "1", "on"})
+
+
+def yes_no_to_bool(value):
+    """Convert a yes/no string to boolean"""
+    return isinstance(value, str) and value.strip().lower() in YES_VALUES
+
 
 class BasePhoneNumberMixin:
     """Mixin for consistent phone number validation across serializers"""
@@ -38,36 +60,262 @@ class BasePhoneNumberMixin:
         return ValidationService.format_ethiopian_phone_number(value)
 
 
-class BaseChoiceModelSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and give each instance copies.
+
+    ModelSerializer re-runs model introspection and deep-copies the declared
+    fields for every instance, which is most of the cost of serializing a
+    single object. Only for serializers whose get_fields() result does not
+    depend on the instance or context; instance-specific tweaks belong in a
+    subclass get_fields() that calls super(). Fields with a nested child
+    (serializers, many-related and list fields) are still deep-copied.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        template = cls.__dict__.get("_fields_template")
+        if template is None:
+            template = super().get_fields()
+            cls._fields_template = template
+        return {
+            name: (
+                copy.deepcopy(field)
+                if hasattr(field, "child") or hasattr(field, "child_relation")
+                else copy.copy(field)
+            )
+            for name, field in template.items()
+        }
+
+
+class BaseChoiceModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Base serializer for choice models to ensure consistency"""
 
     class Meta:
         fields = "__all__"
 
 
-class BaseFieldMappingMixin:
-    """Mixin for handling common field mappings"""
+class CachedChoiceRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that resolves choice-model pks from the process
+    cache instead of issuing a SELECT per field. Other models, and pks not
+    in the cache, go through the regular queryset lookup.
+    """
 
-    def map_integer_field(self, data, source_field, target_field, default=0):
-        """Helper to map string fields to integers with default values"""
-        if source_field in data and not data.get(target_field):
-            try:
-                data[target_field] = int(data.pop(source_field))
-            except (ValueError, TypeError):
-                data[target_field] = default
+    def to_internal_value(self, data):
+        # bool is an int, and the pk lookup would truncate 1.5 to 1
+        if isinstance(data, bool) or (
+            isinstance(data, float) and not data.is_integer()
+        ):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        model_class = self.get_queryset().model
+        # Only exact integers use the cache; anything else (floats, "1.0", ...)
+        # gets the regular field's validation
+        if issubclass(model_class, BaseChoiceModel) and (
+            isinstance(data, int) or (isinstance(data, str) and data.isdecimal())
+        ):
+            choice = ChoiceCacheService.get_choices_by_pk(model_class).get(int(data))
+            if choice is not None:
+                return choice
+        return super().to_internal_value(data)
+
+
+def _model_field_path(model, attrs):
+    """
+    The model fields attrs (a field's source_attrs) walks through, if it
+    walks forward foreign keys to a concrete model field, i.e. plain
+    attribute access with no callables. None otherwise.
+    """
+    path = []
+    for i, attr in enumerate(attrs):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete:
+            return None
+        if i < len(attrs) - 1:
+            if not (field.many_to_one or field.one_to_one):
+                return None
+            model = field.related_model
+        path.append(field)
+    return path
+
+
+class FlatListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer for read-heavy list endpoints. Works out once per list
+    how to read each of the child's fields, then builds the rows in one
+    loop: fields sourced from plain model attributes (including ones
+    reached through foreign keys, e.g. "breed.display_name") are read with
+    operator.attrgetter instead of Field.get_attribute. The output is the
+    same as the child's own to_representation.
+
+    When every field is such a model column, the list can also be rendered
+    from QuerySet.values(*value_paths()) rows, skipping model instances.
+    """
+
+    def _child_model(self):
+        """The child's model, or None if the child renders rows its own way"""
+        child = self.child
+        default_representation = serializers.Serializer.to_representation
+        if type(child).to_representation is not default_representation:
+            return None
+        return getattr(getattr(child, "Meta", None), "model", None)
+
+    def _values_plan(self):
+        """
+        (field_name, field, values path, nullable foreign key paths on the
+        way, pk only) for each readable field of the child, or None if one
+        of them is not read from a model column.
+        """
+        model = self._child_model()
+        if model is None:
+            return None
+        plan = []
+        for field in self.child._readable_fields:
+            attrs = field.source_attrs
+            model_fields = _model_field_path(model, attrs)
+            if model_fields is None:
+                return None
+            # Related fields rendering the pk, e.g. PrimaryKeyRelatedField
+            pk_only = (
+                isinstance(field, RelatedField) and field.use_pk_only_optimization()
+            )
+            if pk_only:
+                if len(attrs) != 1 or not model_fields[0].many_to_one:
+                    return None
+            elif (
+                type(field).get_attribute is not Field.get_attribute
+                or model_fields[-1].is_relation
+            ):
+                return None
+            # Nullable foreign keys on the way; a null one means the field
+            # falls back to its default/allow_null rules
+            links = [
+                "__".join(attrs[:i])
+                for i, model_field in enumerate(model_fields[:-1], 1)
+                if model_field.null
+            ]
+            plan.append((field.field_name, field, "__".join(attrs), links, pk_only))
+        return plan
+
+    def value_paths(self):
+        """
+        The QuerySet.values() paths to fetch for rendering this list from
+        dict rows, or None if the child needs model instances.
+        """
+        plan = self._values_plan()
+        if plan is None:
+            return None
+        paths = []
+        for _, _, path, links, _ in plan:
+            for value_path in (*links, path):
+                if value_path not in paths:
+                    paths.append(value_path)
+        return paths
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, BaseManager) else data
+        rows = list(iterable)
+
+        if rows and isinstance(rows[0], dict):
+            plan = self._values_plan()
+            if plan is None or not all(entry[2] in rows[0] for entry in plan):
+                return super().to_representation(rows)
+            return self._values_representation(rows, plan)
+
+        model = self._child_model()
+        if model is None:
+            return super().to_representation(rows)
+
+        plan = []
+        for field in self.child._readable_fields:
+            getter = None
+            if type(field).get_attribute is Field.get_attribute and (
+                _model_field_path(model, field.source_attrs) is not None
+            ):
+                getter = operator.attrgetter(".".join(field.source_attrs))
+            plan.append((field.field_name, field, getter))
+
+        ret = []
+        for instance in rows:
+            row = {}
+            for field_name, field, getter in plan:
+                try:
+                    if getter is None:
+                        attribute = field.get_attribute(instance)
+                    else:
+                        try:
+                            attribute = getter(instance)
+                        except AttributeError:
+                            # Let the field apply its default/allow_null rules
+                            attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                row[field_name] = self._field_representation(field, attribute)
+            ret.append(row)
+        return ret
+
+    def _values_representation(self, rows, plan):
+        """Render QuerySet.values() rows fetched with value_paths()"""
+        ret = []
+        for values in rows:
+            row = {}
+            for field_name, field, path, links, pk_only in plan:
+                if any(values[link] is None for link in links):
+                    # Same as the AttributeError a model instance raises
+                    try:
+                        attribute = field.get_attribute(None)
+                    except SkipField:
+                        continue
+                elif pk_only:
+                    attribute = PKOnlyObject(pk=values[path])
+                else:
+                    attribute = values[path]
+                row[field_name] = self._field_representation(field, attribute)
+            ret.append(row)
+        return ret
+
+    @staticmethod
+    def _field_representation(field, attribute):
+        check_for_none = (
+            attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        )
+        if check_for_none is None:
+            return None
+        return field.to_representation(attribute)
+
+
+def to_int(default, parse=int):
+    """Build a converter that parses an integer, falling back to a default"""
+
+    def convert(value):
+        try:
+            return int(parse(value))
+        except (ValueError, TypeError):
+            return default
+
+    return convert
+
+
+def or_default(default):
+    """Build a converter that replaces empty values with a default"""
+
+    def convert(value):
+        return value or default
 
-    def map_string_field(self, data, source_field, target_field, default=""):
-        """Helper to map string fields with default values"""
-        if source_field in data and not data.get(target_field):
-            data[target_field] = data.pop(source_field) or default
+    return convert
 
 
 class FarmSerializer(
+    CachedFieldsMixin,
     BasePhoneNumberMixin,
-    BaseFieldMappingMixin,
     serializers.ModelSerializer,
     LoggingMixin,
 ):
+    serializer_related_field = CachedChoiceRelatedField
+
     # Include nested serialization for related fields
     type_of_housing_name = serializers.CharField(
         source="type_of_housing.display_name", read_only=True
@@ -172,37 +420,46 @@ class FarmSerializer(
             "rate_of_water_giving": {"required": False},
         }
 
-    def validate(self, data):
-        """Handle field mapping from incoming form data to model fields"""
-        try:
-            # Map telephone number
-            if "tel_no" in data and not data.get("telephone_number"):
-                tel_no_value = data.pop("tel_no")
-                data["telephone_number"] = (
-                    ValidationService.format_ethiopian_phone_number(tel_no_value)
-                )
-
-            # Map numeric fields
-            self.map_integer_field(data, "fcc_no", "fertility_camp_no", 1)
-            self.map_integer_field(data, "herd_size", "total_number_of_cows", 0)
-            self.map_integer_field(data, "calves", "number_of_calves", 0)
-            self.map_integer_field(data, "milking_cows", "number_of_milking_cows", 0)
+    # Incoming form fields mapped onto model fields: (source, target, converter)
+    field_mappings = (
+        ("tel_no", "telephone_number", ValidationService.format_ethiopian_phone_number),
+        ("fcc_no", "fertility_camp_no", to_int(1)),
+        ("herd_size", "total_number_of_cows", to_int(0)),
+        ("calves", "number_of_calves", to_int(0)),
+        ("milking_cows", "number_of_milking_cows", to_int(0)),
+        ("TDM", "total_daily_milk", to_int(0, parse=float)),
+        ("feed", "main_feed", or_default("")),
+        ("hygiene_score", "farm_hygiene_score", ValidationService.map_hygiene_score),
+    )
 
-            # Map TDM to total_daily_milk
-            if "TDM" in data and not data.get("total_daily_milk"):
-                try:
-                    data["total_daily_milk"] = int(float(data.pop("TDM")))
-                except (ValueError, TypeError):
-                    data["total_daily_milk"] = 0
+    # Incoming form fields naming choice rows: (source, target, choice model)
+    choice_mappings = (
+        ("housing", "type_of_housing", HousingType),
+        ("floor", "type_of_floor", FloorType),
+        ("feeding_rate", "rate_of_cow_feeding", FeedingFrequency),
+        ("water_rate", "rate_of_water_giving", FeedingFrequency),
+        ("water_source", "source_of_water", WaterSource),
+    )
 
-            # Map string fields
-            self.map_string_field(data, "feed", "main_feed")
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.instance is None:
+            # Creates always INSERT, so the farm_id primary key rejects
+            # duplicates (soft-deleted farms included) without a pre-check
+            # SELECT; FarmViewSet.create reports the IntegrityError
+            fields["farm_id"].validators = [
+                validator
+                for validator in fields["farm_id"].validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return fields
 
-            # Map hygiene score
-            if "hygiene_score" in data and not data.get("farm_hygiene_score"):
-                data["farm_hygiene_score"] = ValidationService.map_hygiene_score(
-                    data.pop("hygiene_score")
-                )
+    def validate(self, data):
+        """Handle field mapping from incoming form data to model fields"""
+        try:
+            for source_field, target_field, convert in self.field_mappings:
+                if source_field in data and not data.get(target_field):
+                    data[target_field] = convert(data.pop(source_field))
 
             # Handle choice field mappings
             self._map_choice_fields(data)
@@ -215,32 +472,21 @@ class FarmSerializer(
 
     def _map_choice_fields(self, data):
         """Map housing, floor, feeding, and water source fields"""
-        choice_mappings = [
-            ("housing", "type_of_housing", HousingType),
-            ("floor", "type_of_floor", FloorType),
-            ("feeding_rate", "rate_of_cow_feeding", FeedingFrequency),
-            ("water_rate", "rate_of_water_giving", FeedingFrequency),
-            ("water_source", "source_of_water", WaterSource),
-        ]
-
-        for source_field, target_field, model_class in choice_mappings:
+        for source_field, target_field, model_class in self.choice_mappings:
             if source_field in data and not data.get(target_field):
                 choice_value = data.pop(source_field).replace("_", " ").title()
-                choice_obj = model_class.objects.filter(
-                    models.Q(name__icontains=choice_value)
-                    | models.Q(display_name__icontains=choice_value)
-                ).first()
+                choice_obj = ChoiceCacheService.find_choice(model_class, choice_value)
 
                 if choice_obj:
                     data[target_field] = choice_obj
                 else:
                     # Get first available as fallback
-                    first_choice = model_class.objects.first()
-                    if first_choice:
-                        data[target_field] = first_choice
+                    choices = ChoiceCacheService.get_all_choices(model_class)
+                    if choices:
+                        data[target_field] = choices[0]
 
 
-class CowSerializer(serializers.ModelSerializer):
+class CowSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer focused on READING Cow data with all fields."""
 
     # Customize representation of related fields (optional - show names instead of IDs)
@@ -256,6 +502,7 @@ class CowSerializer(serializers.ModelSerializer):
     class Meta:
         model = Cow
         fields = "__all__"  # Include all model fields
+        list_serializer_class = FlatListSerializer
         # Add 'breed_name', 'gynecological_status_name' to the output list if defined above
         # The actual FK fields ('breed', 'gynecological_status') will still be included by __all__ (as IDs)
         # If you ONLY want the names, list fields explicitly instead of using '__all__'
@@ -273,14 +520,14 @@ class CowSerializer(serializers.ModelSerializer):
 
 
 # Example: A separate serializer for creating cows might look like this
-class CowCreateUpdateSerializer(serializers.ModelSerializer):
+class CowCreateUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     farm_id_input = serializers.CharField(write_only=True, source="farm_id")
     cow_id_input = serializers.CharField(write_only=True, source="cow_id")
 
     # Fields that need conversion
     breed = serializers.CharField(write_only=True)
     gynecological_status_name = serializers.CharField(write_only=True, required=False)
-    gynecological_status = serializers.PrimaryKeyRelatedField(
+    gynecological_status = CachedChoiceRelatedField(
         queryset=GynecologicalStatus.objects.all(), required=False
     )
     has_lameness = serializers.CharField(required=False)
@@ -347,6 +594,21 @@ class CowCreateUpdateSerializer(serializers.ModelSerializer):
             "heat_signs",
         ]
 
+    # Form fields saved on the cow's first MedicalAssessment and Reproduction
+    # records (see CowViewSet.perform_create), not on the Cow itself
+    medical_assessment_fields = (
+        "has_lameness",
+        "reproductive_health",
+        "metabolic_disease",
+        "is_vaccinated",
+        "vaccination_date",
+        "vaccination_type",
+        "deworming_date",
+        "deworming_type",
+        "has_deworming",
+    )
+    reproduction_fields = ("is_pregnant",)
+
     def to_internal_value(self, data):
         """Custom field processing before validation"""
         # Handle lactation_number conversion
@@ -364,28 +626,10 @@ class CowCreateUpdateSerializer(serializers.ModelSerializer):
     def validate_bcs(self, value):
         """Convert string BCS to a valid choice"""
         try:
-            # Convert to float
-            bcs_float = float(value)
-
-            # Clamp to valid range
-            if bcs_float < 1.0:
-                bcs_float = 1.0
-            elif bcs_float > 5.0:
-                bcs_float = 5.0
-
-            # Round to nearest 0.5
-            rounded = round(bcs_float * 2) / 2
-
-            # Get valid choices from model
-            valid_choices = [
-                x / 2 for x in range(2, 11)
-            ]  # [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0]
-
-            # Find closest valid choice
-            valid_bcs = min(valid_choices, key=lambda x: abs(x - rounded))
-
-            # Return as Decimal with str conversion for exact representation
-            return Decimal(str(valid_bcs))
+            # Clamp to the valid range, then round to the nearest 0.5 step,
+            # which is always one of the model's choices
+            bcs_float = min(max(float(value), 1.0), 5.0)
+            return BCS_DECIMALS[round(bcs_float * 2) / 2]
         except (ValueError, TypeError, InvalidOperation):
             raise serializers.ValidationError(
                 "BCS must be a number between 1.0 and 5.0"
@@ -401,21 +645,11 @@ class CowCreateUpdateSerializer(serializers.ModelSerializer):
         except (ValueError, TypeError):
             raise serializers.ValidationError("Lactation number must be a valid number")
 
-    def validate_has_lameness(self, value):
-        """Convert yes/no string to boolean"""
-        return value.lower() == "yes"
-
-    def validate_cow_inseminated_before(self, value):
-        """Convert yes/no string to boolean"""
-        return value.lower() == "yes"
-
-    def validate_is_vaccinated(self, value):
-        """Convert yes/no string to boolean"""
-        return value.lower() == "yes"
-
-    def validate_deworming(self, value):
-        """Convert yes/no string to boolean"""
-        return value.lower() == "yes"
+    # Convert yes/no strings to booleans
+    validate_has_lameness = staticmethod(yes_no_to_bool)
+    validate_cow_inseminated_before = staticmethod(yes_no_to_bool)
+    validate_is_vaccinated = staticmethod(yes_no_to_bool)
+    validate_deworming = staticmethod(yes_no_to_bool)
 
     def validate(self, data):
         """Handle breed and gynecological_status lookups by name"""
@@ -423,44 +657,32 @@ class CowCreateUpdateSerializer(serializers.ModelSerializer):
             # Handle breed lookup
             breed_name = data.pop("breed", None)
             if breed_name:
-                try:
-                    # Try exact match on name
-                    breed = BreedType.objects.get(name__iexact=breed_name)
-                except BreedType.DoesNotExist:
-                    # Try partial match on name or display_name
-                    breed = BreedType.objects.filter(
-                        models.Q(name__icontains=breed_name)
-                        | models.Q(display_name__icontains=breed_name)
-                    ).first()
-
-                    if not breed:
-                        raise serializers.ValidationError(
-                            {"breed": f'Breed "{breed_name}" not found'}
-                        )
+                # Exact name match first, then partial match on name or
+                # display_name
+                breed = ChoiceCacheService.find_choice(
+                    BreedType, breed_name, prefer_exact_name=True
+                )
+                if not breed:
+                    raise serializers.ValidationError(
+                        {"breed": f'Breed "{breed_name}" not found'}
+                    )
 
                 data["breed"] = breed
 
             # Handle gynecological status lookup if name provided
             gyn_status_name = data.pop("gynecological_status_name", None)
             if gyn_status_name and "gynecological_status" not in data:
-                try:
-                    # Try exact match on name
-                    gyn_status = GynecologicalStatus.objects.get(
-                        name__iexact=gyn_status_name
+                # Exact name match first, then partial match on name or
+                # display_name
+                gyn_status = ChoiceCacheService.find_choice(
+                    GynecologicalStatus, gyn_status_name, prefer_exact_name=True
+                )
+                if not gyn_status:
+                    raise serializers.ValidationError(
+                        {
+                            "gynecological_status": f'Status "{gyn_status_name}" not found'
+                        }
                     )
-                except GynecologicalStatus.DoesNotExist:
-                    # Try partial match on name or display_name
-                    gyn_status = GynecologicalStatus.objects.filter(
-                        models.Q(name__icontains=gyn_status_name)
-                        | models.Q(display_name__icontains=gyn_status_name)
-                    ).first()
-
-                    if not gyn_status:
-                        raise serializers.ValidationError(
-                            {
-                                "gynecological_status": f'Status "{gyn_status_name}" not found'
-                            }
-                        )
 
                 data["gynecological_status"] = gyn_status
 
@@ -483,37 +705,29 @@ class CowCreateUpdateSerializer(serializers.ModelSerializer):
             )
 
         try:
-            # Get farm
-            farm = Farm.objects.get(farm_id=farm_id)
+            # Get farm, with the doctor CowViewSet.perform_create assigns to
+            # the initial medical assessment
+            farm = Farm.objects.select_related("doctor").get(farm_id=farm_id)
             validated_data["farm"] = farm
             if cow_id:
                 validated_data["cow_id"] = cow_id
 
             # Extract non-Cow model fields for later use
-            medical_fields = {}
-            reproduction_fields = {}
-
-            # Fields for Medical Assessment
-            for field in [
-                "has_lameness",
-                "reproductive_health",
-                "metabolic_disease",
-                "is_vaccinated",
-                "vaccination_date",
-                "vaccination_type",
-                "deworming_date",
-                "deworming_type",
-                "has_deworming",
-            ]:
-                if field in validated_data:
-                    medical_fields[field] = validated_data.pop(field)
-
-            # Fields for Reproduction
-            if "is_pregnant" in validated_data:
-                reproduction_fields["is_pregnant"] = validated_data.pop("is_pregnant")
-
-            # Create the cow instance with only valid Cow model fields
-            instance = super().create(validated_data)
+            medical_fields = {
+                field: validated_data.pop(field)
+                for field in self.medical_assessment_fields
+                if field in validated_data
+            }
+            reproduction_fields = {
+                field: validated_data.pop(field)
+                for field in self.reproduction_fields
+                if field in validated_data
+            }
+
+            # Create the cow instance with only valid Cow model fields. The
+            # savepoint keeps the transaction usable if the INSERT fails.
+            with transaction.atomic():
+                instance = super().create(validated_data)
 
             # Save extracted data in view's perform_create method
             self.context["medical_fields"] = medical_fields
@@ -524,6 +738,15 @@ class CowCreateUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 {"farm_id_input": f"Farm with ID {farm_id} not found"}
             )
+        except IntegrityError as e:
+            duplicate = Cow.objects.all_with_deleted().filter(
+                farm_id=farm_id, cow_id=cow_id
+            )
+            if not duplicate.exists():
+                raise serializers.ValidationError(f"Error creating cow: {str(e)}")
+            raise serializers.ValidationError(
+                {"cow_id_input": APIMessages.COW_ALREADY_EXISTS.format(cow_id=cow_id)}
+            )
         except Exception as e:
             raise serializers.ValidationError(f"Error creating cow: {str(e)}")
 
@@ -557,6 +780,8 @@ class MessageSerializer(serializers.ModelSerializer):
 
 
 class MedicalAssessmentSerializer(serializers.ModelSerializer):
+    serializer_related_field = CachedChoiceRelatedField
+
     class Meta:
         model = MedicalAssessment
         fields = "__all__"
@@ -628,37 +853,165 @@ class ReproductionSerializer(serializers.ModelSerializer):
 class StaffAssignmentSerializer(serializers.Serializer):
     staff_id = serializers.IntegerField(required=True)
 
-    def validate(self, attrs):
-        return NotImplementedError("child classes must implement this method")
+    # Set by child classes: the staff model and its name in error messages
+    staff_model = None
+    staff_label = None
+
+    def validate_staff_id(self, value):
+        # Only the is_active flag is needed, not the whole staff record
+        try:
+            is_active = self.staff_model.objects.values_list(
+                "is_active", flat=True
+            ).get(pk=value)
+        except self.staff_model.DoesNotExist:
+            raise serializers.ValidationError(f"{self.staff_label} Not Found")
+        if not is_active:
+            raise serializers.ValidationError(f"{self.staff_label} is not active")
+        return value
 
 
 class InseminatorAssignmentSerializer(StaffAssignmentSerializer):
     staff_id = serializers.IntegerField(required=True, source="inseminator_id")
-
-    def validate_staff_id(self, value):
-        try:
-            inseminator = Inseminator.objects.get(id=value)
-            if not inseminator.is_active:
-                raise serializers.ValidationError("Inseminator is not active")
-            return value
-        except Inseminator.DoesNotExist:
-            raise serializers.ValidationError("Inseminator Not Found")
+    staff_model = Inseminator
+    staff_label = "Inseminator"
 
 
 class DoctorAssignmentSerializer(StaffAssignmentSerializer):
     staff_id = serializers.IntegerField(required=True, source="doctor_id")
+    staff_model = Doctor
+    staff_label = "Doctor"
+
+
+def get_farm_cow(farm_id, cow_id):
+    """
+    Get a farm's cow for the monitoring forms, joined with the farm and its
+    doctor and inseminator, which validation and the views then read.
+    Raises Cow.DoesNotExist.
+    """
+    return Cow.objects.select_related("farm__doctor", "farm__inseminator").get(
+        farm__farm_id=farm_id, cow_id=cow_id
+    )
 
-    def validate_staff_id(self, value):
+
+def map_field_aliases(processed_data, field_mappings):
+    """
+    Rename the alias keys of a monitoring form to their serializer field
+    names, unless the field is already given. When several aliases of one
+    field are present, the first in field_mappings wins.
+    """
+    if not processed_data.keys() & field_mappings.keys():
+        return
+    for old_name, new_name in field_mappings.items():
+        if old_name in processed_data and new_name not in processed_data:
+            processed_data[new_name] = processed_data.pop(old_name)
+            logger.info(
+                "Mapped field %s to %s: %s",
+                old_name,
+                new_name,
+                processed_data[new_name],
+            )
+
+
+# Formats accepted for heat_start_time, in the order they are tried
+HEAT_START_TIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f+03:00",  # 2025-05-21T12:06:00.000+03:00 (specific timezone)
+    "%Y-%m-%dT%H:%M:%S.%f%z",  # 2025-05-21T12:06:00.000+0300 (timezone offset)
+    "%Y-%m-%dT%H:%M:%S%z",  # 2025-05-21T12:06:00+0300 (timezone offset)
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # 2025-05-28T09:47:42.988Z
+    "%Y-%m-%dT%H:%M:%SZ",  # 2025-05-28T09:47:42Z
+    "%Y-%m-%dT%H:%M:%S",  # 2025-05-28T09:47:42
+    "%Y-%m-%d %H:%M:%S.%f",  # 2025-05-28 09:47:42.988
+    "%Y-%m-%d %H:%M:%S",  # 2025-05-28 09:47:42
+    "%Y-%m-%d %H:%M",  # 2025-05-28 09:47
+    "%d/%m/%Y %H:%M:%S",  # 28/05/2025 09:47:42
+    "%d/%m/%Y %H:%M",  # 28/05/2025 09:47
+    "%m/%d/%Y %H:%M:%S",  # 05/28/2025 09:47:42
+    "%m/%d/%Y %H:%M",  # 05/28/2025 09:47
+    "%Y-%m-%d",  # 2025-05-28 (will add current time)
+    "%H:%M:%S.%f+03:00",  # 12:45:00.000+03:00 (time only - will add today's date)
+    "%H:%M:%S.%f%z",  # 12:45:00.000+0300 (time only with timezone)
+    "%H:%M:%S%z",  # 12:45:00+0300 (time only with timezone)
+)
+
+
+def _datetime_shape(value):
+    """
+    Classify a datetime string or format by its separators: "T", "/" and " "
+    datetimes, ":" time only, "-" date only. A string can only be parsed by
+    formats of the same shape.
+    """
+    for separator in ("T", "/", " "):
+        if separator in value:
+            return separator
+    return ":" if ":" in value else "-"
+
+
+HEAT_START_TIME_FORMATS_BY_SHAPE = {}
+for _fmt in HEAT_START_TIME_FORMATS:
+    HEAT_START_TIME_FORMATS_BY_SHAPE.setdefault(_datetime_shape(_fmt), []).append(_fmt)
+
+
+# ISO datetimes the first "T" formats accept: (fraction, offset or Z)
+ISO_HEAT_START_TIME = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}"
+    r"(\.[0-9]{1,6})?(Z|[+-][0-9]{2}:?[0-5][0-9])?"
+)
+
+
+def _parse_iso_heat_start_time(value):
+    """
+    Parse ISO values with datetime.fromisoformat (C) instead of strptime,
+    returning what the first matching HEAT_START_TIME_FORMATS entry would:
+    a literal "+03:00" after a fraction is dropped (naive), other offsets
+    and "Z" are kept (aware). (None, None) if the value needs the format
+    list.
+    """
+    match = ISO_HEAT_START_TIME.fullmatch(value)
+    if match is None:
+        return None, None
+    fraction, offset = match.groups()
+    if fraction and offset == "+03:00":
+        value, fmt = value[:-6], HEAT_START_TIME_FORMATS[0]
+    elif offset:
+        fmt = HEAT_START_TIME_FORMATS[1 if fraction else 2]
+    elif not fraction:
+        fmt = "%Y-%m-%dT%H:%M:%S"
+    else:
+        # No format takes a fraction without an offset
+        return None, None
+    try:
+        return datetime.fromisoformat(value), fmt
+    except ValueError:  # e.g. out-of-range fields
+        return None, None
+
+
+def parse_heat_start_time(value):
+    """
+    Parse a heat_start_time string, returning (datetime, format) or
+    (None, None). ISO values go through fromisoformat; otherwise only
+    formats of the value's shape are tried, then the full list as a
+    fallback, so the result matches trying every format in order.
+    Date-only values get the current time, time-only values today's date.
+    """
+    parsed, fmt = _parse_iso_heat_start_time(value)
+    if parsed is not None:
+        return parsed, fmt
+    shape_formats = HEAT_START_TIME_FORMATS_BY_SHAPE.get(_datetime_shape(value), [])
+    for fmt in (*shape_formats, *HEAT_START_TIME_FORMATS):
         try:
-            doctor = Doctor.objects.get(id=value)
-            if not doctor.is_active:
-                raise serializers.ValidationError("Doctor is not active")
-            return value
-        except Doctor.DoesNotExist:
-            raise serializers.ValidationError("Doctor Not Found")
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        shape = _datetime_shape(fmt)
+        if shape == "-":
+            parsed = datetime.combine(parsed.date(), datetime.now().time())
+        elif shape == ":":
+            parsed = datetime.combine(date.today(), parsed.time())
+        return parsed, fmt
+    return None, None
 
 
-class HeatSignRecordSerializer(serializers.Serializer):
+class HeatSignRecordSerializer(CachedFieldsMixin, serializers.Serializer):
     farm_id = serializers.CharField(required=True)
     cow_id = serializers.CharField(required=True)
     heat_signs = serializers.CharField(required=False, default="", allow_blank=True)
@@ -669,92 +1022,26 @@ class HeatSignRecordSerializer(serializers.Serializer):
         """
         Override to handle custom datetime parsing for heat_start_time
         """
-        logger.info(f"to_internal_value called with data: {data}")
-
-        if "heat_start_time" in data and isinstance(data["heat_start_time"], str):
-            logger.info(f"Processing heat_start_time: '{data['heat_start_time']}'")
-            # Parse different datetime formats
-            datetime_str = data["heat_start_time"]
-            parsed_datetime = None
-
-            # List of common datetime formats to try
-            datetime_formats = [
-                "%Y-%m-%dT%H:%M:%S.%f+03:00",  # 2025-05-21T12:06:00.000+03:00 (specific timezone)
-                "%Y-%m-%dT%H:%M:%S.%f%z",  # 2025-05-21T12:06:00.000+0300 (timezone offset)
-                "%Y-%m-%dT%H:%M:%S%z",  # 2025-05-21T12:06:00+0300 (timezone offset)
-                "%Y-%m-%dT%H:%M:%S.%fZ",  # 2025-05-28T09:47:42.988Z
-                "%Y-%m-%dT%H:%M:%SZ",  # 2025-05-28T09:47:42Z
-                "%Y-%m-%dT%H:%M:%S",  # 2025-05-28T09:47:42
-                "%Y-%m-%d %H:%M:%S.%f",  # 2025-05-28 09:47:42.988
-                "%Y-%m-%d %H:%M:%S",  # 2025-05-28 09:47:42
-                "%Y-%m-%d %H:%M",  # 2025-05-28 09:47
-                "%d/%m/%Y %H:%M:%S",  # 28/05/2025 09:47:42
-                "%d/%m/%Y %H:%M",  # 28/05/2025 09:47
-                "%m/%d/%Y %H:%M:%S",  # 05/28/2025 09:47:42
-                "%m/%d/%Y %H:%M",  # 05/28/2025 09:47
-                "%Y-%m-%d",  # 2025-05-28 (will add current time)
-                "%H:%M:%S.%f+03:00",  # 12:45:00.000+03:00 (time only - will add today's date)
-                "%H:%M:%S.%f%z",  # 12:45:00.000+0300 (time only with timezone)
-                "%H:%M:%S%z",  # 12:45:00+0300 (time only with timezone)
-            ]
-
-            for fmt in datetime_formats:
-                try:
-                    from datetime import datetime
-
-                    parsed_datetime = datetime.strptime(datetime_str, fmt)
-                    logger.info(
-                        f"Successfully parsed datetime with format '{fmt}': {parsed_datetime}"
-                    )
-
-                    # If only date was provided, use current time
-                    if fmt == "%Y-%m-%d":
-                        from datetime import time
-
-                        now = datetime.now()
-                        parsed_datetime = datetime.combine(
-                            parsed_datetime.date(), now.time()
-                        )
-                        logger.info(f"Combined with current time: {parsed_datetime}")
-
-                    # If only time was provided (with timezone), use today's date
-                    elif fmt in ["%H:%M:%S.%f+03:00", "%H:%M:%S.%f%z", "%H:%M:%S%z"]:
-                        from datetime import date
-
-                        today = date.today()
-                        parsed_datetime = datetime.combine(
-                            today, parsed_datetime.time()
-                        )
-                        logger.info(
-                            f"Combined time with today's date: {parsed_datetime}"
-                        )
-
-                    # Convert to ISO format that Django expects
-                    iso_format = parsed_datetime.isoformat()
-                    data["heat_start_time"] = iso_format
-                    logger.info(f"Converted to ISO format: {iso_format}")
-                    break
-                except ValueError as e:
-                    logger.debug(f"Format '{fmt}' failed: {e}")
-                    continue
-
+        datetime_str = data.get("heat_start_time")
+        if isinstance(datetime_str, str):
+            parsed_datetime, fmt = parse_heat_start_time(datetime_str)
             if parsed_datetime is None:
                 logger.warning(
-                    f"Failed to parse datetime '{datetime_str}' with any format"
+                    "Failed to parse datetime '%s' with any format", datetime_str
                 )
-                # If all parsing attempts failed, let Django handle it and show proper error
-                pass
+                # Let Django handle it and show the proper error
+            else:
+                logger.debug("Parsed heat_start_time with format '%s'", fmt)
+                # Convert to ISO format that Django expects
+                data["heat_start_time"] = parsed_datetime.isoformat()
         else:
-            logger.info(
-                f"heat_start_time not found or not a string: {data.get('heat_start_time')}"
-            )
+            logger.debug("heat_start_time not found or not a string: %s", datetime_str)
 
-        logger.info(f"Calling super().to_internal_value with data: {data}")
         return super().to_internal_value(data)
 
     def validate(self, data):
         try:
-            cow = Cow.objects.get(farm__farm_id=data["farm_id"], cow_id=data["cow_id"])
+            cow = get_farm_cow(data["farm_id"], data["cow_id"])
             if not cow.farm.inseminator:
                 raise serializers.ValidationError(
                     "No inseminator assigned to this farm"
@@ -762,21 +1049,14 @@ class HeatSignRecordSerializer(serializers.Serializer):
             if not cow.farm.inseminator.is_active:
                 raise serializers.ValidationError("Assigned inseminator is not active")
             data["cow"] = cow
-            if (
-                "heat_sign_recorded_at" not in data
-                or data["heat_sign_recorded_at"] is None
-            ):
-                data["heat_sign_recorded_at"] = datetime.now()
             return data
         except Cow.DoesNotExist:
             raise serializers.ValidationError(
                 f"Cow {data['cow_id']} not found in farm {data['farm_id']}"
             )
-        except Exception as e:
-            raise serializers.ValidationError(f"Validation Error: {str(e)}")
 
 
-class MonitorPregnancySerializer(serializers.Serializer):
+class MonitorPregnancySerializer(CachedFieldsMixin, serializers.Serializer):
     farm_id = serializers.CharField(
         required=True,
         help_text="This identifies where the cow belongs (This is initially given to you)",
@@ -797,49 +1077,49 @@ class MonitorPregnancySerializer(serializers.Serializer):
         required=True, help_text="What is the number of lactation for the cow so far?"
     )
 
+    # Frontend aliases of the form fields
+    field_mappings = {
+        "farmid": "farm_id",
+        "farm": "farm_id",
+        "cowid": "cow_id",
+        "cow": "cow_id",
+        "Date_of_the_pregnancy": "pregnancy_date",  # Added exact frontend field name
+        "pregnancy": "pregnancy_date",
+        "date_pregnancy": "pregnancy_date",
+        "until_claving": "days_until_calving",  # Added exact frontend field name
+        "days_until_calving_date": "days_until_calving",
+        "days_to_calving": "days_until_calving",
+        "nsc": "service_per_conception",  # Added exact frontend field name
+        "services_per_conception": "service_per_conception",
+        "service_count": "service_per_conception",
+        "lactation_no": "lactation_number",  # Added exact frontend field name
+        "lactation": "lactation_number",
+        "lactation_num": "lactation_number",
+    }
+
+    # Fields the frontend may send as (decimal) number strings
+    integer_fields = (
+        "days_until_calving",
+        "service_per_conception",
+        "lactation_number",
+    )
+
     def to_internal_value(self, data):
         """
         Handle field mapping and data conversion
         """
-        logger.info(f"MonitorPregnancySerializer received data: {data}")
+        logger.info("MonitorPregnancySerializer received data: %s", data)
 
         # Create a copy of data to avoid modifying the original
         processed_data = data.copy()
 
-        # Handle potential field name variations
-        field_mappings = {
-            "farmid": "farm_id",
-            "farm": "farm_id",
-            "cowid": "cow_id",
-            "cow": "cow_id",
-            "Date_of_the_pregnancy": "pregnancy_date",  # Added exact frontend field name
-            "pregnancy": "pregnancy_date",
-            "date_pregnancy": "pregnancy_date",
-            "until_claving": "days_until_calving",  # Added exact frontend field name
-            "days_until_calving_date": "days_until_calving",
-            "days_to_calving": "days_until_calving",
-            "nsc": "service_per_conception",  # Added exact frontend field name
-            "services_per_conception": "service_per_conception",
-            "service_count": "service_per_conception",
-            "lactation_no": "lactation_number",  # Added exact frontend field name
-            "lactation": "lactation_number",
-            "lactation_num": "lactation_number",
-        }
-
-        for old_name, new_name in field_mappings.items():
-            if old_name in processed_data and new_name not in processed_data:
-                processed_data[new_name] = processed_data.pop(old_name)
-                logger.info(
-                    f"Mapped field {old_name} to {new_name}: {processed_data[new_name]}"
-                )
+        map_field_aliases(processed_data, self.field_mappings)
 
         # Handle date parsing if it comes as datetime string
         if "pregnancy_date" in processed_data:
             pregnancy_date_value = processed_data["pregnancy_date"]
             if isinstance(pregnancy_date_value, str):
                 try:
-                    from datetime import datetime
-
                     # Try to parse datetime string and extract date
                     if "T" in pregnancy_date_value:
                         parsed_datetime = datetime.fromisoformat(
@@ -847,43 +1127,39 @@ class MonitorPregnancySerializer(serializers.Serializer):
                         )
                         processed_data["pregnancy_date"] = parsed_datetime.date()
                         logger.info(
-                            f"Converted datetime to date: {processed_data['pregnancy_date']}"
+                            "Converted datetime to date: %s",
+                            processed_data["pregnancy_date"],
                         )
                 except Exception as e:
-                    logger.warning(f"Could not parse pregnancy_date: {e}")
+                    logger.warning("Could not parse pregnancy_date: %s", e)
                     # Let the normal validation handle it
 
         # Handle numeric fields that might come as strings
-        numeric_fields = [
-            "days_until_calving",
-            "service_per_conception",
-            "lactation_number",
-        ]
-        for field in numeric_fields:
+        for field in self.integer_fields:
             if field in processed_data and isinstance(processed_data[field], str):
                 try:
                     # Handle decimal values by converting to int
                     processed_data[field] = int(float(processed_data[field]))
                     logger.info(
-                        f"Converted {field} to integer: {processed_data[field]}"
+                        "Converted %s to integer: %s", field, processed_data[field]
                     )
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not convert {field} to integer: {e}")
+                    logger.warning("Could not convert %s to integer: %s", field, e)
                     # Let the normal validation handle it
 
-        logger.info(f"Processed pregnancy data: {processed_data}")
+        logger.info("Processed pregnancy data: %s", processed_data)
         return super().to_internal_value(processed_data)
 
     def validate(self, data):
         try:
-            cow = Cow.objects.get(farm__farm_id=data["farm_id"], cow_id=data["cow_id"])
+            cow = get_farm_cow(data["farm_id"], data["cow_id"])
             data["cow"] = cow
             return data
         except Cow.DoesNotExist:
             raise serializers.ValidationError("Cow not found")
 
 
-class FarmerMedicalAssessmentSerializer(serializers.Serializer):
+class FarmerMedicalAssessmentSerializer(CachedFieldsMixin, serializers.Serializer):
     farm_id = serializers.CharField(required=True)
     cow_id = serializers.CharField(required=True)
     sickness_description = serializers.CharField(required=True)
@@ -923,7 +1199,7 @@ class FarmerMedicalAssessmentSerializer(serializers.Serializer):
 
     def validate(self, data):
         try:
-            cow = Cow.objects.get(farm__farm_id=data["farm_id"], cow_id=data["cow_id"])
+            cow = get_farm_cow(data["farm_id"], data["cow_id"])
             if not cow.farm.doctor:
                 raise serializers.ValidationError("No doctor assigned to this farm")
             data["cow"] = cow
@@ -932,7 +1208,7 @@ class FarmerMedicalAssessmentSerializer(serializers.Serializer):
             raise serializers.ValidationError("Cow not found")
 
 
-class DoctorMedicalAssessmentSerializer(serializers.Serializer):
+class DoctorMedicalAssessmentSerializer(CachedFieldsMixin, serializers.Serializer):
     farm_id = serializers.CharField(required=True)
     cow_id = serializers.CharField(required=True)
     doctor_id = serializers.IntegerField(
@@ -970,38 +1246,65 @@ class DoctorMedicalAssessmentSerializer(serializers.Serializer):
     next_assessment_date = serializers.DateField(required=False, allow_null=True)
     notes = serializers.CharField(required=False, allow_blank=True)
 
+    # Choice models of the health status fields, resolved by name through
+    # the choice cache
+    health_status_models = {
+        "general_health": GeneralHealthStatus,
+        "udder_health": UdderHealthStatus,
+        "mastitis": MastitisStatus,
+    }
+
+    # Frontend values of the health status fields and the status names they
+    # stand for; other values are looked up as names as they are
+    health_status_names = {
+        "general_health": {
+            "normal": "Normal",
+            "poor": "Poor",
+            "good": "Good",
+            "excellent": "Excellent",
+        },
+        "udder_health": {
+            "4qt": "4qt normal",
+            "4qt_normal": "4qt normal",
+            "3qt": "3qt normal",
+            "2qt": "2qt normal",
+            "1qt": "1qt normal",
+        },
+        "mastitis": {
+            "clinical_mastitis": "Clinical mastitis",
+            "subclinical_mastitis": "Subclinical mastitis",
+            "no_mastitis": "No mastitis",
+        },
+    }
+
+    # Frontend aliases of the form fields
+    field_mappings = {
+        "cow_sick": "is_cow_sick",
+        "bcs": "body_condition_score",
+        "is_vaccinated": "is_cow_vaccinated",
+    }
+
+    # Frontend answers of the yes/no questions
+    yes_no_answers = {"yes": True, "yes_sick": True, "no": False, "no_sick": False}
+
     def to_internal_value(self, data):
         """
         Handle field mapping and data conversion from frontend format
         """
-        logger.info(f"DoctorMedicalAssessmentSerializer received data: {data}")
+        logger.info("DoctorMedicalAssessmentSerializer received data: %s", data)
 
         # Create a copy of data to avoid modifying the original
         processed_data = data.copy()
 
-        # Field mappings
-        field_mappings = {
-            "cow_sick": "is_cow_sick",
-            "bcs": "body_condition_score",
-            "is_vaccinated": "is_cow_vaccinated",
-        }
-
-        for old_name, new_name in field_mappings.items():
-            if old_name in processed_data and new_name not in processed_data:
-                processed_data[new_name] = processed_data.pop(old_name)
-                logger.info(
-                    f"Mapped field {old_name} to {new_name}: {processed_data[new_name]}"
-                )
+        map_field_aliases(processed_data, self.field_mappings)
 
         # Convert yes/no strings to booleans
-        boolean_fields = ["is_cow_sick", "is_cow_vaccinated", "has_deworming"]
-        for field in boolean_fields:
+        for field in ("is_cow_sick", "is_cow_vaccinated", "has_deworming"):
             if field in processed_data and isinstance(processed_data[field], str):
-                if processed_data[field].lower() in ["yes", "yes_sick"]:
-                    processed_data[field] = True
-                elif processed_data[field].lower() in ["no", "no_sick"]:
-                    processed_data[field] = False
-                logger.info(f"Converted {field} to boolean: {processed_data[field]}")
+                processed_data[field] = self.yes_no_answers.get(
+                    processed_data[field].lower(), processed_data[field]
+                )
+                logger.info("Converted %s to boolean: %s", field, processed_data[field])
 
         # Convert deworming field specifically
         if "deworming" in processed_data:
@@ -1009,93 +1312,75 @@ class DoctorMedicalAssessmentSerializer(serializers.Serializer):
                 processed_data.pop("deworming").lower() == "yes"
             )
             logger.info(
-                f"Converted deworming to has_deworming: {processed_data['has_deworming']}"
+                "Converted deworming to has_deworming: %s",
+                processed_data["has_deworming"],
             )
 
         # Convert health status names to IDs
-        health_status_mappings = {
-            "general_health": {
-                "normal": "Normal",
-                "poor": "Poor",
-                "good": "Good",
-                "excellent": "Excellent",
-            },
-            "udder_health": {
-                "4qt": "4qt normal",
-                "4qt_normal": "4qt normal",
-                "3qt": "3qt normal",
-                "2qt": "2qt normal",
-                "1qt": "1qt normal",
-            },
-            "mastitis": {
-                "clinical_mastitis": "Clinical mastitis",
-                "subclinical_mastitis": "Subclinical mastitis",
-                "no_mastitis": "No mastitis",
-            },
-        }
-
-        for field, mapping in health_status_mappings.items():
+        for field, mapping in self.health_status_names.items():
             if field in processed_data and isinstance(processed_data[field], str):
                 status_name = mapping.get(
                     processed_data[field].lower(), processed_data[field]
                 )
+                model_class = self.health_status_models[field]
                 try:
-                    if field == "general_health":
-                        status_obj = GeneralHealthStatus.objects.get(name=status_name)
-                    elif field == "udder_health":
-                        status_obj = UdderHealthStatus.objects.get(name=status_name)
-                    elif field == "mastitis":
-                        status_obj = MastitisStatus.objects.get(name=status_name)
-
+                    status_obj = ChoiceCacheService.get_choice(model_class, status_name)
                     processed_data[field] = status_obj.id
                     logger.info(
-                        f"Converted {field} '{processed_data[field]}' to ID: {status_obj.id}"
+                        "Converted %s '%s' to ID: %s",
+                        field,
+                        processed_data[field],
+                        status_obj.id,
                     )
                 except Exception as e:
                     logger.warning(
-                        f"Could not find {field} status '{status_name}': {e}"
+                        "Could not find %s status '%s': %s", field, status_name, e
                     )
                     # Try to get the first available status as fallback
                     try:
-                        if field == "general_health":
-                            fallback = GeneralHealthStatus.objects.first()
-                        elif field == "udder_health":
-                            fallback = UdderHealthStatus.objects.first()
-                        elif field == "mastitis":
-                            fallback = MastitisStatus.objects.first()
-
-                        if fallback:
+                        choices = ChoiceCacheService.get_all_choices(model_class)
+                        if choices:
+                            fallback = choices[0]
                             processed_data[field] = fallback.id
-                            logger.info(f"Using fallback {field} ID: {fallback.id}")
+                            logger.info("Using fallback %s ID: %s", field, fallback.id)
                     except Exception as fallback_error:
                         logger.error(
-                            f"Could not get fallback for {field}: {fallback_error}"
+                            "Could not get fallback for %s: %s", field, fallback_error
                         )
 
-        # Auto-assign doctor - always use farm's doctor
-        try:
-            # Get the farm's assigned doctor
-            farm = Farm.objects.get(farm_id=processed_data["farm_id"])
-            if farm.doctor:
-                processed_data["doctor_id"] = farm.doctor.id
-                logger.info(f"Using farm's assigned doctor ID: {farm.doctor.id}")
-            else:
-                # If no doctor assigned to farm, raise an error
-                logger.error(f"No doctor assigned to farm {processed_data['farm_id']}")
-                raise serializers.ValidationError("No doctor assigned to this farm")
-        except Farm.DoesNotExist:
-            logger.error(f"Farm {processed_data['farm_id']} not found")
-            raise serializers.ValidationError("Farm not found")
-        except Exception as e:
-            logger.error(f"Error getting farm's doctor: {e}")
-            raise serializers.ValidationError("Error retrieving farm's doctor")
+        # Auto-assign doctor - always use farm's doctor. A missing farm_id is
+        # reported by the field validation below.
+        if "farm_id" in processed_data:
+            farm_id = processed_data["farm_id"]
+            try:
+                # Only the doctor's ID is needed here, the doctor itself is
+                # loaded with the cow in validate()
+                doctor_id = Farm.objects.values_list("doctor_id", flat=True).get(
+                    farm_id=farm_id
+                )
+            except Farm.DoesNotExist:
+                logger.error("Farm %s not found", farm_id)
+                raise serializers.ValidationError(
+                    {api_settings.NON_FIELD_ERRORS_KEY: ["Farm not found"]}
+                )
+            if not doctor_id:
+                logger.error("No doctor assigned to farm %s", farm_id)
+                raise serializers.ValidationError(
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: [
+                            "No doctor assigned to this farm"
+                        ]
+                    }
+                )
+            processed_data["doctor_id"] = doctor_id
+            logger.info("Using farm's assigned doctor ID: %s", doctor_id)
 
-        logger.info(f"Processed data: {processed_data}")
+        logger.info("Processed data: %s", processed_data)
         return super().to_internal_value(processed_data)
 
     def validate(self, data):
         try:
-            cow = Cow.objects.get(farm__farm_id=data["farm_id"], cow_id=data["cow_id"])
+            cow = get_farm_cow(data["farm_id"], data["cow_id"])
 
             # Use the farm's assigned doctor
             doctor = cow.farm.doctor
@@ -1158,7 +1443,7 @@ class DoctorMedicalAssessmentSerializer(serializers.Serializer):
         }
 
 
-class MonitorHeatSignSerializer(serializers.Serializer):
+class MonitorHeatSignSerializer(CachedFieldsMixin, serializers.Serializer):
     farm_id = serializers.CharField(required=True, help_text="Farm identifier")
     cow_id = serializers.CharField(required=True, help_text="Cow identifier")
     inseminated_now = serializers.CharField(
@@ -1174,29 +1459,24 @@ class MonitorHeatSignSerializer(serializers.Serializer):
         required=True, help_text="What is the lactation number for the cow?"
     )
 
+    # Frontend aliases of the form fields
+    field_mappings = {
+        "insemination_date": "date_of_insemination",
+        "inseminated_date": "date_of_insemination",
+        "date_insemination": "date_of_insemination",
+        "Date_of_Insemination": "date_of_insemination",  # Added this mapping
+    }
+
     def to_internal_value(self, data):
         """
         Handle field mapping and data conversion
         """
-        logger.info(f"MonitorHeatSignSerializer received data: {data}")
+        logger.info("MonitorHeatSignSerializer received data: %s", data)
 
         # Create a copy of data to avoid modifying the original
         processed_data = data.copy()
 
-        # Handle potential field name variations
-        field_mappings = {
-            "insemination_date": "date_of_insemination",
-            "inseminated_date": "date_of_insemination",
-            "date_insemination": "date_of_insemination",
-            "Date_of_Insemination": "date_of_insemination",  # Added this mapping
-        }
-
-        for old_name, new_name in field_mappings.items():
-            if old_name in processed_data and new_name not in processed_data:
-                processed_data[new_name] = processed_data.pop(old_name)
-                logger.info(
-                    f"Mapped field {old_name} to {new_name}: {processed_data[new_name]}"
-                )
+        map_field_aliases(processed_data, self.field_mappings)
 
         # Special handling: If we have both date and time in separate fields, combine them
         if (
@@ -1204,13 +1484,11 @@ class MonitorHeatSignSerializer(serializers.Serializer):
             and "inseminated_time" in processed_data
         ):
             try:
-                from datetime import date, datetime
-
                 # Parse the date
                 if isinstance(processed_data["date_of_insemination"], str):
-                    insemination_date = datetime.strptime(
-                        processed_data["date_of_insemination"], "%Y-%m-%d"
-                    ).date()
+                    insemination_date = date.fromisoformat(
+                        processed_data["date_of_insemination"]
+                    )
                 else:
                     insemination_date = processed_data["date_of_insemination"]
 
@@ -1222,11 +1500,12 @@ class MonitorHeatSignSerializer(serializers.Serializer):
                 processed_data.pop("inseminated_time", None)
 
                 logger.info(
-                    f"Combined date and time into date_of_insemination: {processed_data['date_of_insemination']}"
+                    "Combined date and time into date_of_insemination: %s",
+                    processed_data["date_of_insemination"],
                 )
 
-            except Exception as e:
-                logger.error(f"Error combining date and time fields: {e}")
+            except ValueError as e:
+                logger.error("Error combining date and time fields: %s", e)
                 # If parsing fails, let the normal validation handle it
 
         return super().to_internal_value(processed_data)
@@ -1237,7 +1516,7 @@ class MonitorHeatSignSerializer(serializers.Serializer):
             data["insemination_count"] = int(data["insemination_number"])
             data["lactation_number"] = int(data["lactation_no"])
 
-            cow = Cow.objects.get(farm__farm_id=data["farm_id"], cow_id=data["cow_id"])
+            cow = get_farm_cow(data["farm_id"], data["cow_id"])
 
             if not cow.farm.inseminator:
                 raise serializers.ValidationError(
@@ -1263,7 +1542,7 @@ class MonitorHeatSignSerializer(serializers.Serializer):
             )
 
 
-class MonitorBirthSerializer(serializers.Serializer):
+class MonitorBirthSerializer(CachedFieldsMixin, serializers.Serializer):
     farm_id = serializers.CharField(
         required=True,
         help_text="This identifies where the cow belongs (This is initially given to you)",
@@ -1279,58 +1558,60 @@ class MonitorBirthSerializer(serializers.Serializer):
         choices=["M", "F"], required=True, help_text="What is the Sex of the Calf?"
     )
 
+    # Frontend aliases of the form fields
+    field_mappings = {
+        "farmid": "farm_id",
+        "farm": "farm_id",
+        "cowid": "cow_id",
+        "cow": "cow_id",
+        "calving": "calving_date",
+        "birth_date": "calving_date",
+        "date_of_calving": "calving_date",
+        "Date_of_Calving": "calving_date",  # Added exact frontend field name
+        "last_calving": "last_calving_date",
+        "previous_calving_date": "last_calving_date",
+        "Date_of_last_calving": "last_calving_date",  # Added exact frontend field name
+        "sex": "calf_sex",
+        "calf_gender": "calf_sex",
+        "gender": "calf_sex",
+        "What_is_the_Sex_of_the_Calf": "calf_sex",  # Added exact frontend field name
+    }
+
+    # Frontend answers of the calf's sex
+    calf_sex_values = {
+        **dict.fromkeys(("MALE", "BULL", "BOY", "M", "MALE_MALE"), "M"),
+        **dict.fromkeys(("FEMALE", "COW", "GIRL", "F", "FEMALE_FEMALE"), "F"),
+    }
+
     def to_internal_value(self, data):
         """
         Handle field mapping and data conversion
         """
-        logger.info(f"MonitorBirthSerializer received data: {data}")
+        logger.info("MonitorBirthSerializer received data: %s", data)
 
         # Create a copy of data to avoid modifying the original
         processed_data = data.copy()
 
-        # Handle potential field name variations
-        field_mappings = {
-            "farmid": "farm_id",
-            "farm": "farm_id",
-            "cowid": "cow_id",
-            "cow": "cow_id",
-            "calving": "calving_date",
-            "birth_date": "calving_date",
-            "date_of_calving": "calving_date",
-            "Date_of_Calving": "calving_date",  # Added exact frontend field name
-            "last_calving": "last_calving_date",
-            "previous_calving_date": "last_calving_date",
-            "Date_of_last_calving": "last_calving_date",  # Added exact frontend field name
-            "sex": "calf_sex",
-            "calf_gender": "calf_sex",
-            "gender": "calf_sex",
-            "What_is_the_Sex_of_the_Calf": "calf_sex",  # Added exact frontend field name
-        }
-
-        for old_name, new_name in field_mappings.items():
-            if old_name in processed_data and new_name not in processed_data:
-                processed_data[new_name] = processed_data.pop(old_name)
-                logger.info(
-                    f"Mapped field {old_name} to {new_name}: {processed_data[new_name]}"
-                )
+        map_field_aliases(processed_data, self.field_mappings)
 
         # Handle sex field normalization
         if "calf_sex" in processed_data:
             sex_value = str(processed_data["calf_sex"]).upper()
-            if sex_value in ["MALE", "BULL", "BOY", "M", "MALE_MALE"]:
-                processed_data["calf_sex"] = "M"
-            elif sex_value in ["FEMALE", "COW", "GIRL", "F", "FEMALE_FEMALE"]:
-                processed_data["calf_sex"] = "F"
+            processed_data["calf_sex"] = self.calf_sex_values.get(
+                sex_value, processed_data["calf_sex"]
+            )
             logger.info(
-                f"Normalized calf_sex from '{processed_data.get('calf_sex')}' to: {processed_data['calf_sex']}"
+                "Normalized calf_sex from '%s' to: %s",
+                processed_data.get("calf_sex"),
+                processed_data["calf_sex"],
             )
 
-        logger.info(f"Processed birth data: {processed_data}")
+        logger.info("Processed birth data: %s", processed_data)
         return super().to_internal_value(processed_data)
 
     def validate(self, data):
         try:
-            cow = Cow.objects.get(farm__farm_id=data["farm_id"], cow_id=data["cow_id"])
+            cow = get_farm_cow(data["farm_id"], data["cow_id"])
             data["cow"] = cow
             return data
         except Cow.DoesNotExist:
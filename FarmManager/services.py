@@ -3,15 +3,17 @@ Business logic services for the Farm Manager application
 """
 
 import logging
+import time
 from typing import Any, Dict, Optional, Tuple
 
+from django.core.cache import cache
 from django.db import transaction
 
 from AlertSystem.sendMesage import send_alert
 
 from .constants import DefaultHealthStatus, MessageTemplates, MessageTypes
-from .models import (Doctor, GeneralHealthStatus, MastitisStatus, Message,
-                     UdderHealthStatus)
+from .models import (BaseChoiceModel, Doctor, GeneralHealthStatus,
+                     MastitisStatus, Message, UdderHealthStatus)
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +175,99 @@ class MessagingService:
         return results
 
 
+class ChoiceCacheService:
+    """
+    Per-process cache for the choice tables (HousingType, BreedType, ...)
+
+    These tables hold a handful of rows, so lookups are served from memory.
+    Every worker keeps its own copy: saves and deletes clear the copy of the
+    worker that made them (see signals.py), other workers reload theirs once
+    it is CACHE_TIMEOUT old, and a lookup that misses reloads straight away
+    so rows added elsewhere (populate_choices, another worker) are found.
+    The serialized choice lists of the API are kept in the configured Django
+    cache for the same CACHE_TIMEOUT, as it is per-process too unless a
+    shared backend is set up.
+    """
+
+    CACHE_TIMEOUT = 60  # seconds
+
+    # model class -> (monotonic load time, {pk: choice})
+    _choices: Dict[Any, Tuple[float, Dict[int, Any]]] = {}
+
+    @staticmethod
+    def _load(model_class, reload: bool = False) -> Dict[int, Any]:
+        """The cached choices of a model, reloaded when stale or asked to"""
+        entry = ChoiceCacheService._choices.get(model_class)
+        now = time.monotonic()
+        if reload or entry is None or now - entry[0] > ChoiceCacheService.CACHE_TIMEOUT:
+            entry = (now, {choice.pk: choice for choice in model_class.objects.all()})
+            ChoiceCacheService._choices[model_class] = entry
+        return entry[1]
+
+    @staticmethod
+    def get_choice(model_class, name: str):
+        """Get a choice object by name (raises DoesNotExist if there is none)"""
+        for reload in (False, True):
+            for choice in ChoiceCacheService._load(model_class, reload).values():
+                if choice.name == name:
+                    return choice
+        raise model_class.DoesNotExist(
+            f"{model_class.__name__} matching name={name!r} does not exist."
+        )
+
+    @staticmethod
+    def get_choices_by_pk(model_class) -> Dict[int, Any]:
+        """Get all choice objects of a model keyed by primary key"""
+        return ChoiceCacheService._load(model_class)
+
+    @staticmethod
+    def get_all_choices(model_class) -> Tuple[Any, ...]:
+        """Get all choice objects of a model in their default ordering"""
+        return tuple(ChoiceCacheService._load(model_class).values())
+
+    @staticmethod
+    def find_choice(model_class, value: str, prefer_exact_name: bool = False):
+        """
+        Find a choice from free text: the first choice (default ordering)
+        whose name or display_name contains the value, ignoring case. With
+        prefer_exact_name, a case-insensitive exact name match wins.
+        Returns None when nothing matches.
+        """
+        needle = value.lower()
+        for reload in (False, True):
+            choices = ChoiceCacheService._load(model_class, reload).values()
+            if prefer_exact_name:
+                for choice in choices:
+                    if choice.name.lower() == needle:
+                        return choice
+            for choice in choices:
+                if (
+                    needle in choice.name.lower()
+                    or needle in choice.display_name.lower()
+                ):
+                    return choice
+        return None
+
+    @staticmethod
+    def list_cache_key(model_class) -> str:
+        """Cache key of the serialized choice list of a model"""
+        return f"choice-list:{model_class._meta.label}"
+
+    @staticmethod
+    def clear(model_class=None):
+        """
+        Drop every cached choice lookup, and the cached choice list of
+        model_class (of every choice model if not given)
+        """
+        ChoiceCacheService._choices.clear()
+        model_classes = (
+            [model_class] if model_class else BaseChoiceModel.__subclasses__()
+        )
+        cache.delete_many(
+            [ChoiceCacheService.list_cache_key(model) for model in model_classes]
+        )
+
+
 class HealthService:
     """Service class to handle health-related operations"""
 
@@ -187,14 +282,14 @@ class HealthService:
             Tuple of (general_health, udder_health, mastitis) objects
         """
         try:
-            general_health = GeneralHealthStatus.objects.get(
-                name=DefaultHealthStatus.GENERAL_HEALTH_NORMAL
+            general_health = ChoiceCacheService.get_choice(
+                GeneralHealthStatus, DefaultHealthStatus.GENERAL_HEALTH_NORMAL
             )
-            udder_health = UdderHealthStatus.objects.get(
-                name=DefaultHealthStatus.UDDER_HEALTH_NORMAL
+            udder_health = ChoiceCacheService.get_choice(
+                UdderHealthStatus, DefaultHealthStatus.UDDER_HEALTH_NORMAL
             )
-            mastitis = MastitisStatus.objects.get(
-                name=DefaultHealthStatus.MASTITIS_CLINICAL
+            mastitis = ChoiceCacheService.get_choice(
+                MastitisStatus, DefaultHealthStatus.MASTITIS_CLINICAL
             )
             return general_health, udder_health, mastitis
         except Exception as e:
@@ -1,8 +1,9 @@
-from django.db.models import Count, Q
+from django.db.models import OuterRef
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Cow, Farm
+from .models import BaseChoiceModel, Cow, Farm
+from .services import ChoiceCacheService
 
 
 @receiver(post_save, sender=Cow)
@@ -10,21 +11,28 @@ from .models import Cow, Farm
 def update_farm_counts(sender, instance, **kwargs):
     """
     Update Farm statistics whenever a Cow is added, updated, or deleted.
+    The counts are recomputed inside a single UPDATE of the two counter
+    columns, so the farm row is not loaded or rewritten in full.
     """
-    farm = instance.farm
-    # Calculate new stats
-    # We filter by is_deleted=False because we only want active cows
-    all_active_cows = Cow.objects.filter(farm=farm, is_deleted=False)
-    # 1. Total Cows
-    total_cows = all_active_cows.count()
-    farm.total_number_of_cows = total_cows
-    # 2. Milking Cows
-    # Logic: Cows with average_daily_milk > 0 are considered milking
-    milking_cows = all_active_cows.filter(average_daily_milk__gt=0).count()
-    farm.number_of_milking_cows = milking_cows
-    # 3. Calves (Optional placeholder)
-    # farm.number_of_calves = ...
-    farm.save()
+    # Cow.objects already excludes soft-deleted cows
+    farm_cows = Cow.objects.filter(farm=OuterRef("pk"))
+    Farm.objects.filter(pk=instance.farm_id).update(
+        total_number_of_cows=farm_cows.correlated_count("farm"),
+        # Cows with average_daily_milk > 0 are considered milking
+        number_of_milking_cows=farm_cows.filter(
+            average_daily_milk__gt=0
+        ).correlated_count("farm"),
+    )
+
+
+def clear_choice_cache(sender, **kwargs):
+    """Invalidate cached choice lookups when a choice row changes."""
+    ChoiceCacheService.clear(sender)
+
+
+for choice_model in BaseChoiceModel.__subclasses__():
+    post_save.connect(clear_choice_cache, sender=choice_model)
+    post_delete.connect(clear_choice_cache, sender=choice_model)
 
 
 # from django.db.models.signals import post_save, post_delete
@@ -1,3 +1,83 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from .models import BreedType
+from .pagination import EstimatedCountPaginator, LargeResultsSetPagination
+
+
+def estimate_rows(rows):
+    """Pretend the planner statistics put the table at the given size"""
+    return mock.patch.object(
+        EstimatedCountPaginator, "estimated_table_rows", return_value=rows
+    )
+
+
+class LargeResultsSetPaginationTests(TestCase):
+    def setUp(self):
+        self.add_breeds(0, 25)
+
+    @staticmethod
+    def add_breeds(start, stop):
+        BreedType.objects.bulk_create(
+            [
+                BreedType(name=f"breed{i:03}", display_name=f"Breed {i}")
+                for i in range(start, stop)
+            ]
+        )
+
+    @staticmethod
+    def paginate(page):
+        paginator = LargeResultsSetPagination()
+        request = Request(APIRequestFactory().get("/", {"page": page, "page_size": 10}))
+        rows = paginator.paginate_queryset(BreedType.objects.all(), request)
+        return paginator.get_paginated_response([row.name for row in rows]).data
+
+    def test_estimate_above_threshold(self):
+        with estimate_rows(250_000), CaptureQueriesContext(connection) as queries:
+            data = self.paginate(1)
+        self.assertEqual(data["count"], 250_000)
+        self.assertEqual(data["total_pages"], 25_000)
+        self.assertFalse(any("COUNT" in query["sql"] for query in queries))
+
+    def test_exact_count_below_threshold(self):
+        with estimate_rows(1_000):
+            self.assertEqual(self.paginate(1)["count"], 25)
+        with estimate_rows(None):
+            self.assertEqual(self.paginate(1)["count"], 25)
+
+    def test_last_page_has_no_next_whatever_the_count(self):
+        with estimate_rows(250_000):
+            data = self.paginate(3)
+        self.assertEqual(len(data["results"]), 5)
+        self.assertIsNone(data["next"])
+        self.assertIsNotNone(data["previous"])
+
+    def test_page_past_the_rows_is_not_found_whatever_the_count(self):
+        with estimate_rows(250_000), self.assertRaises(NotFound):
+            self.paginate(4)
+
+    def test_next_and_pages_follow_new_rows(self):
+        # The estimate lags behind the inserts; next and the pages do not
+        with estimate_rows(150_000):
+            self.assertIsNone(self.paginate(3)["next"])
+            self.add_breeds(25, 35)
+            self.assertIsNotNone(self.paginate(3)["next"])
+            self.assertEqual(len(self.paginate(4)["results"]), 5)
+
+    def test_default_page_size(self):
+        user = get_user_model().objects.create_user(
+            "admin", password="pw", is_staff=True
+        )
+        client = APIClient()
+        client.force_authenticate(user)
 
-# Create your tests here.
+        response = client.get("/api/messages/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["page_size"], 50)
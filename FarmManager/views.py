@@ -18,7 +18,8 @@ The refactoring focuses on:
 
 import logging
 
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.http import JsonResponse
 from django.utils.timezone import now, timezone
@@ -33,12 +34,15 @@ from rest_framework.response import Response
 from AlertSystem.sendMesage import send_alert
 
 from .constants import APIMessages, MessageTemplates, MessageTypes
+from .middleware import check_deadline
 from .models import MedicalAssessment  # Changed from Health
 from .models import (BreedType, Cow, Doctor, Farm, FarmerMedicalReport,
                      FeedingFrequency, FloorType, GeneralHealthStatus,
                      GynecologicalStatus, HousingType, InseminationRecord,
                      Inseminator, MastitisStatus, Message, Reproduction,
                      UdderHealthStatus, WaterSource)
+from .pagination import (LargeResultsSetPagination,
+                         OptionalCursorPaginationMixin)
 from .permissions import AdminGetOnlyPermission, ReadOnlyAdminPermission
 from .serializers import (BreedTypeSerializer, CowCreateUpdateSerializer,
                           CowSerializer, DoctorAssignmentSerializer,
@@ -56,23 +60,15 @@ from .serializers import (BreedTypeSerializer, CowCreateUpdateSerializer,
                           MonitorBirthSerializer, MonitorHeatSignSerializer,
                           MonitorPregnancySerializer, ReproductionSerializer,
                           UdderHealthStatusSerializer, WaterSourceSerializer)
-from .services import (HealthService, LoggingMixin, MessagingService,
-                       ResponseService, ValidationService)
+from .services import (ChoiceCacheService, HealthService, LoggingMixin,
+                       MessagingService, ResponseService, ValidationService)
 
 # initiating the logger
 logger = logging.getLogger(__name__)
 
 
 class FarmViewSet(viewsets.ModelViewSet, LoggingMixin):
-    queryset = Farm.objects.select_related(
-        "type_of_housing",
-        "type_of_floor",
-        "source_of_water",
-        "rate_of_cow_feeding",
-        "rate_of_water_giving",
-        "inseminator",
-        "doctor",
-    )
+    queryset = Farm.objects.with_related()
     serializer_class = FarmSerializer
     permission_classes = [AdminGetOnlyPermission]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
@@ -89,6 +85,11 @@ class FarmViewSet(viewsets.ModelViewSet, LoggingMixin):
         "cluster_number",
     ]  # For partial matches
 
+    def get_queryset(self):
+        if self.action == "list":
+            return Farm.objects.list_fields()
+        return super().get_queryset()
+
     def create(self, request, *args, **kwargs):
         """Create a new farm with logging"""
         self.log_request_received("farm creation", request.data)
@@ -98,7 +99,18 @@ class FarmViewSet(viewsets.ModelViewSet, LoggingMixin):
                 self.log_validation_error("farm creation", serializer.errors)
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            farm = serializer.save()
+            try:
+                farm = serializer.save()
+            except IntegrityError:
+                farm_id = serializer.validated_data.get("farm_id")
+                if not Farm.objects.all_with_deleted().filter(farm_id=farm_id).exists():
+                    raise
+                errors = {
+                    "farm_id": [APIMessages.FARM_ALREADY_EXISTS.format(farm_id=farm_id)]
+                }
+                self.log_validation_error("farm creation", errors)
+                return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
             self.log_operation_success("created farm", f"with ID: {farm.farm_id}")
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -284,10 +296,7 @@ class FarmViewSet(viewsets.ModelViewSet, LoggingMixin):
 
 
 class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
-    queryset = Cow.objects.select_related(
-        "farm",
-        "breed",
-        "gynecological_status",
+    queryset = Cow.objects.with_related().select_related(
         "farm__type_of_housing",
         "farm__type_of_floor",
         "farm__inseminator",
@@ -299,6 +308,17 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
     search_fields = ["cow_id", "breed__name"]
     filterset_fields = ["farm_id"]
 
+    def get_queryset(self):
+        if self.action in ("list", "by_farm"):
+            # Lists render straight from .values() rows, without building
+            # Cow instances, when every CowSerializer field is a column
+            paths = self.get_serializer(many=True).value_paths()
+            if paths:
+                return Cow.objects.values(*paths)
+            # CowSerializer only reads the farm's id and owner
+            return Cow.objects.list_fields()
+        return super().get_queryset()
+
     def get_serializer_class(self):
         """Use different serializers for different operations"""
         if self.action in ["create", "update", "partial_update"]:
@@ -505,12 +525,16 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
     def record_heat_sign(self, request):
         """Record heat sign for a cow and send notifications"""
         self.log_request_received("heat sign recording")
-        self.get_logger().info(f"Raw request data: {request.data}")
-
-        # Log the specific heat_start_time format being received
+        # Payload traces are debug level with lazy arguments, so they cost
+        # nothing under the INFO production config
+        logger = self.get_logger()
+        logger.debug("Raw request data: %s", request.data)
         if "heat_start_time" in request.data:
-            self.get_logger().info(
-                f"Heat start time received: '{request.data['heat_start_time']}' (type: {type(request.data['heat_start_time'])})"
+            raw_heat_start_time = request.data["heat_start_time"]
+            logger.debug(
+                "Heat start time received: '%s' (type: %s)",
+                raw_heat_start_time,
+                type(raw_heat_start_time),
             )
 
         serializer = HeatSignRecordSerializer(data=request.data)
@@ -522,7 +546,9 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
             cow = serializer.validated_data["cow"]
             heat_signs = serializer.validated_data["heat_signs"]
             heat_start_time = serializer.validated_data["heat_start_time"]
-            heat_sign_recorded_at = serializer.validated_data["heat_sign_recorded_at"]
+            heat_sign_recorded_at = serializer.validated_data.get(
+                "heat_sign_recorded_at"
+            )
 
             self.log_operation_success(
                 "recording heat sign",
@@ -574,6 +600,7 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
             f"for cow {cow.cow_id} from farm {cow.farm.farm_id}",
         )
 
+        heat_sign_recorded_at = heat_sign_recorded_at or now()
         reproduction, created = Reproduction.objects.get_or_create(
             cow=cow,
             farm=cow.farm,
@@ -581,15 +608,14 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
                 "is_cow_pregnant": False,
                 "heat_sign_start": heat_start_time,
                 "heat_signs_seen": heat_signs,
-                "heat_sign_recorded_at": heat_sign_recorded_at or now(),
+                "heat_sign_recorded_at": heat_sign_recorded_at,
             },
         )
 
         if not created:
             reproduction.heat_sign_start = heat_start_time
             reproduction.heat_signs_seen = heat_signs
-            if heat_sign_recorded_at:
-                reproduction.heat_sign_recorded_at = heat_sign_recorded_at
+            reproduction.heat_sign_recorded_at = heat_sign_recorded_at
             reproduction.save()
 
         self.log_operation_success(
@@ -1066,7 +1092,7 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        queryset = Reproduction.objects.filter(
+        queryset = Reproduction.objects.with_related().filter(
             farm__farm_id=farm_id, is_cow_pregnant=True
         )
 
@@ -1075,6 +1101,7 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
 
         data = []
         for record in queryset:
+            check_deadline(request)
             data.append(
                 {
                     "farm_id": record.farm.farm_id,
@@ -1100,7 +1127,7 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        queryset = Reproduction.objects.filter(
+        queryset = Reproduction.objects.with_related().filter(
             farm__farm_id=farm_id, calving_date__isnull=False
         )
 
@@ -1109,6 +1136,7 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
 
         data = []
         for record in queryset:
+            check_deadline(request)
             data.append(
                 {
                     "farm_id": record.farm.farm_id,
@@ -1137,12 +1165,15 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
         data = []
 
         if record_type in ["reproduction", "all"]:
-            reproduction_queryset = Reproduction.objects.filter(
-                farm__farm_id=farm_id, is_cow_pregnant=False
-            ).order_by("-heat_sign_recorded_at")
+            reproduction_queryset = (
+                Reproduction.objects.with_related()
+                .filter(farm__farm_id=farm_id, is_cow_pregnant=False)
+                .order_by("-heat_sign_recorded_at")
+            )
             if cow_id:
                 reproduction_queryset = reproduction_queryset.filter(cow__cow_id=cow_id)
             for record in reproduction_queryset:
+                check_deadline(request)
                 data.append(
                     {
                         "type": "reproduction",
@@ -1155,12 +1186,15 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
                 )
 
         if record_type in ["insemination", "all"]:
-            insemination_queryset = InseminationRecord.objects.filter(
-                farm__farm_id=farm_id
-            ).order_by("-recorded_date")
+            insemination_queryset = (
+                InseminationRecord.objects.with_related()
+                .filter(farm__farm_id=farm_id)
+                .order_by("-recorded_date")
+            )
             if cow_id:
                 insemination_queryset = insemination_queryset.filter(cow__cow_id=cow_id)
             for record in insemination_queryset:
+                check_deadline(request)
                 data.append(
                     {
                         "type": "insemination",
@@ -1192,11 +1226,14 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
 
         # Get farmer medical reports if requested
         if record_type in ["farmer", "all"]:
-            farmer_reports = FarmerMedicalReport.objects.filter(farm__farm_id=farm_id)
+            farmer_reports = FarmerMedicalReport.objects.with_related().filter(
+                farm__farm_id=farm_id
+            )
             if cow_id:
                 farmer_reports = farmer_reports.filter(cow__cow_id=cow_id)
 
             for report in farmer_reports:
+                check_deadline(request)
                 data.append(
                     {
                         "type": "farmer_report",
@@ -1214,11 +1251,14 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
 
         # Get doctor medical assessments if requested
         if record_type in ["doctor", "all"]:
-            assessments = MedicalAssessment.objects.filter(farm__farm_id=farm_id)
+            assessments = MedicalAssessment.objects.with_related().filter(
+                farm__farm_id=farm_id
+            )
             if cow_id:
                 assessments = assessments.filter(cow__cow_id=cow_id)
 
             for assessment in assessments:
+                check_deadline(request)
                 data.append(
                     {
                         "type": "doctor_assessment",
@@ -1251,15 +1291,16 @@ class CowViewSet(viewsets.ModelViewSet, LoggingMixin):
         return Response(data)
 
 
-class MessageViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Message.objects.select_related("farm", "cow")
+class MessageViewSet(OptionalCursorPaginationMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Message.objects.with_related()
     serializer_class = MessageSerializer
     permission_classes = [ReadOnlyAdminPermission]
+    pagination_class = LargeResultsSetPagination
     filter_backends = [filters.SearchFilter]
     search_fields = ["message_text", "message_type"]
 
     def get_queryset(self):
-        queryset = Message.objects.select_related("farm", "cow")
+        queryset = Message.objects.with_related()
         farm_id = self.request.query_params.get("farm_id", None)
         cow_id = self.request.query_params.get("cow_id", None)
 
@@ -1333,14 +1374,14 @@ class InseminatorViewSet(viewsets.ModelViewSet):
 
 
 class ReproductionViewSet(viewsets.ModelViewSet):
-    queryset = Reproduction.objects.select_related("cow", "farm")
+    queryset = Reproduction.objects.with_related()
     serializer_class = ReproductionSerializer
     permission_classes = [AdminGetOnlyPermission]
     filter_backends = [filters.SearchFilter]
     search_fields = ["cow__cow_id", "farm__farm_id"]
 
     def get_queryset(self):
-        queryset = Reproduction.objects.select_related("cow", "farm")
+        queryset = Reproduction.objects.with_related()
         farm_id = self.request.query_params.get("farm_id", None)
         cow_id = self.request.query_params.get("cow_id", None)
         is_pregnant = self.request.query_params.get("is_pregnant", None)
@@ -1356,7 +1397,31 @@ class ReproductionViewSet(viewsets.ModelViewSet):
 
 
 # Choice Models ViewSets (Read-only)
-class BreedTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class CachedChoiceListMixin:
+    """
+    Serve the plain (no query parameters) list of a choice table from the
+    cache. Searches, ordering and explicit pages still go to the database.
+    The cache is per-process and misses writes made elsewhere (bulk_create,
+    other workers), so entries only live for ChoiceCacheService.CACHE_TIMEOUT.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        key = ChoiceCacheService.list_cache_key(self.queryset.model)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        # Only single-page lists: next/previous links depend on the request
+        if not response.data.get("next"):
+            cache.set(key, response.data, ChoiceCacheService.CACHE_TIMEOUT)
+        return response
+
+
+class BreedTypeViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = BreedType.objects.all()
     serializer_class = BreedTypeSerializer
     permission_classes = [ReadOnlyAdminPermission]
@@ -1364,71 +1429,70 @@ class BreedTypeViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ["name", "display_name"]
 
 
-class HousingTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class HousingTypeViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = HousingType.objects.all()
     serializer_class = HousingTypeSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class FloorTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class FloorTypeViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = FloorType.objects.all()
     serializer_class = FloorTypeSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class FeedingFrequencyViewSet(viewsets.ReadOnlyModelViewSet):
+class FeedingFrequencyViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = FeedingFrequency.objects.all()
     serializer_class = FeedingFrequencySerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class WaterSourceViewSet(viewsets.ReadOnlyModelViewSet):
+class WaterSourceViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = WaterSource.objects.all()
     serializer_class = WaterSourceSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class GynecologicalStatusViewSet(viewsets.ReadOnlyModelViewSet):
+class GynecologicalStatusViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = GynecologicalStatus.objects.all()
     serializer_class = GynecologicalStatusSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class UdderHealthStatusViewSet(viewsets.ReadOnlyModelViewSet):
+class UdderHealthStatusViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = UdderHealthStatus.objects.all()
     serializer_class = UdderHealthStatusSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class MastitisStatusViewSet(viewsets.ReadOnlyModelViewSet):
+class MastitisStatusViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = MastitisStatus.objects.all()
     serializer_class = MastitisStatusSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class GeneralHealthStatusViewSet(viewsets.ReadOnlyModelViewSet):
+class GeneralHealthStatusViewSet(CachedChoiceListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = GeneralHealthStatus.objects.all()
     serializer_class = GeneralHealthStatusSerializer
     permission_classes = [ReadOnlyAdminPermission]
     search_fields = ["name", "display_name"]
 
 
-class FarmerMedicalReportViewSet(viewsets.ModelViewSet):
-    queryset = FarmerMedicalReport.objects.select_related("farm", "cow", "reviewed_by")
+class FarmerMedicalReportViewSet(OptionalCursorPaginationMixin, viewsets.ModelViewSet):
+    queryset = FarmerMedicalReport.objects.with_related()
     serializer_class = FarmerMedicalReportSerializer
     permission_classes = [AdminGetOnlyPermission]
+    pagination_class = LargeResultsSetPagination
 
     def get_queryset(self):
-        queryset = FarmerMedicalReport.objects.select_related(
-            "farm", "cow", "reviewed_by"
-        )
+        queryset = FarmerMedicalReport.objects.with_related()
         farm_id = self.request.query_params.get("farm_id", None)
         cow_id = self.request.query_params.get("cow_id", None)
         is_reviewed = self.request.query_params.get("is_reviewed", None)
@@ -1443,17 +1507,14 @@ class FarmerMedicalReportViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class MedicalAssessmentViewSet(viewsets.ModelViewSet):
-    queryset = MedicalAssessment.objects.select_related(
-        "farm", "cow", "assessed_by", "general_health", "udder_health", "mastitis"
-    )
+class MedicalAssessmentViewSet(OptionalCursorPaginationMixin, viewsets.ModelViewSet):
+    queryset = MedicalAssessment.objects.with_related()
     serializer_class = MedicalAssessmentSerializer
     permission_classes = [AdminGetOnlyPermission]
+    pagination_class = LargeResultsSetPagination
 
     def get_queryset(self):
-        queryset = MedicalAssessment.objects.select_related(
-            "farm", "cow", "assessed_by", "general_health", "udder_health", "mastitis"
-        )
+        queryset = MedicalAssessment.objects.with_related()
         farm_id = self.request.query_params.get("farm_id", None)
         cow_id = self.request.query_params.get("cow_id", None)
         doctor_id = self.request.query_params.get("doctor_id", None)
@@ -1471,15 +1532,14 @@ class MedicalAssessmentViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class InseminationRecordViewSet(viewsets.ModelViewSet):
-    queryset = InseminationRecord.objects.select_related("farm", "cow", "inseminator")
+class InseminationRecordViewSet(OptionalCursorPaginationMixin, viewsets.ModelViewSet):
+    queryset = InseminationRecord.objects.with_related()
     serializer_class = InseminationRecordSerializer
     permission_classes = [AdminGetOnlyPermission]
+    pagination_class = LargeResultsSetPagination
 
     def get_queryset(self):
-        queryset = InseminationRecord.objects.select_related(
-            "farm", "cow", "inseminator"
-        )
+        queryset = InseminationRecord.objects.with_related()
         farm_id = self.request.query_params.get("farm_id", None)
         cow_id = self.request.query_params.get("cow_id", None)
         inseminator_id = self.request.query_params.get("inseminator_id", None)